@@ -7,7 +7,7 @@ Provides analysis components for content understanding:
 """
 
 from .content_analyzer import ContentAnalyzer, AnalysisResult, Algorithm, Architecture, Dependency
-from .code_detector import CodeDetector, CodeFragment, PseudocodeBlock
+from .code_detector import CodeDetector, CodeFragment, CodeBlockAnalysis, PseudocodeBlock
 
 __all__ = [
     'ContentAnalyzer',
@@ -17,5 +17,6 @@ __all__ = [
     'Dependency',
     'CodeDetector',
     'CodeFragment',
+    'CodeBlockAnalysis',
     'PseudocodeBlock',
 ]
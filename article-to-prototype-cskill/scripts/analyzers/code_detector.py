@@ -5,12 +5,60 @@ Detects and analyzes code fragments, pseudocode, and language hints.
 """
 
 import logging
+import os
 import re
-from typing import List, Optional
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Fewer code blocks than this are analyzed serially (pool startup dominates)
+PARALLEL_MIN_BLOCKS = 1000
+
+# Block batches handed to each worker; several per worker balances uneven blocks
+CHUNKS_PER_WORKER = 4
+
+PSEUDOCODE_INDICATORS = [
+    'algorithm', 'procedure', 'begin', 'end', 'step', 'input:', 'output:'
+]
+MIN_PSEUDOCODE_INDICATORS = 2
+
+LANGUAGE_INDICATORS = {
+    'python': ['def ', 'import ', 'print(', 'self.', '__init__'],
+    'javascript': ['function', 'const ', 'let ', '=>', 'console.'],
+    'java': ['public class', 'void ', 'System.out'],
+    'c++': ['#include', 'cout', 'std::'],
+    'rust': ['fn ', 'let mut', 'impl '],
+    'go': ['func ', 'package ', ':='],
+}
+# Indicators a block without a language tag needs before one is assumed
+MIN_LANGUAGE_INDICATORS = 2
+
+ALGORITHMIC_KEYWORDS = [
+    'def ', 'function ', 'procedure',
+    'for ', 'while ', 'loop',
+    'if ', 'else', 'switch', 'case',
+    'return', 'yield'
+]
+MIN_ALGORITHMIC_KEYWORDS = 3
+
+# Import statements and install commands, one capture group each. They are
+# matched as one alternation so a block is scanned once; names are reported
+# grouped by pattern, in this order.
+LIBRARY_PATTERNS = [
+    r'\b(?:import|from|require|include)\s+([a-zA-Z_][\w.]*)',
+    r'\b(?:using|with)\s+([a-zA-Z_][\w.]*)',
+    r'\bpip install\s+([a-zA-Z_][\w-]*)',
+    r'\bnpm install\s+([a-zA-Z_][\w-]*)',
+]
+# Matched against the lowercased block: case-insensitive matching would
+# disable the regex engine's prefix scan, and the leading class lets it skip
+# positions that cannot start a keyword
+LIBRARY_PATTERN = re.compile(r'(?=[fimnprwu])(?:' + '|'.join(LIBRARY_PATTERNS) + ')')
+# For blocks whose length changes when lowercased
+LIBRARY_PATTERN_ANY_CASE = re.compile('|'.join(LIBRARY_PATTERNS), re.IGNORECASE)
+
 
 @dataclass
 class CodeFragment:
@@ -21,6 +69,15 @@ class CodeFragment:
     line_number: int
 
 
+@dataclass
+class CodeBlockAnalysis:
+    """Everything learned from one code block in a single visit"""
+    fragment_type: str  # 'code' or 'pseudocode'
+    language: Optional[str]  # tagged language, else inferred from indicators
+    imports: List[str] = field(default_factory=list)  # top-level library names
+    is_algorithmic: bool = False
+
+
 @dataclass
 class PseudocodeBlock:
     """Represents a pseudocode block"""
@@ -32,31 +89,59 @@ class PseudocodeBlock:
 class CodeDetector:
     """Detects code and pseudocode in content"""
 
-    PSEUDOCODE_INDICATORS = [
-        'algorithm', 'procedure', 'begin', 'end', 'step', 'input:', 'output:'
-    ]
-
-    LANGUAGE_INDICATORS = {
-        'python': ['def ', 'import ', 'print(', 'self.', '__init__'],
-        'javascript': ['function', 'const ', 'let ', '=>', 'console.'],
-        'java': ['public class', 'void ', 'System.out'],
-        'c++': ['#include', 'cout', 'std::'],
-        'rust': ['fn ', 'let mut', 'impl '],
-        'go': ['func ', 'package ', ':='],
-    }
-
-    def detect_code_fragments(self, content: Any) -> List[CodeFragment]:
-        """Detect all code and pseudocode fragments"""
+    PSEUDOCODE_INDICATORS = PSEUDOCODE_INDICATORS
+
+    LANGUAGE_INDICATORS = LANGUAGE_INDICATORS
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize code detector.
+
+        Args:
+            workers: Processes used to analyze large numbers of code blocks
+                (default: CPU count; 1 disables parallel analysis)
+        """
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    def analyze_code_blocks(self, code_blocks: List[Any]) -> List[CodeBlockAnalysis]:
+        """
+        Analyze every code block in one pass (see analyze_code_blocks()).
+
+        Args:
+            code_blocks: CodeBlock objects from an extractor
+
+        Returns:
+            One CodeBlockAnalysis per block, in order
+        """
+        return analyze_code_blocks(code_blocks, workers=self.workers)
+
+    def detect_code_fragments(
+        self,
+        content: Any,
+        block_analyses: Optional[List[CodeBlockAnalysis]] = None
+    ) -> List[CodeFragment]:
+        """
+        Detect all code and pseudocode fragments.
+
+        Args:
+            content: ExtractedContent object from extractor
+            block_analyses: Result of analyze_code_blocks() for
+                content.code_blocks, if already computed
+
+        Returns:
+            List of CodeFragment objects
+        """
+        if block_analyses is None:
+            block_analyses = self.analyze_code_blocks(content.code_blocks)
+
         fragments = []
 
         # Code blocks from extractors
-        for i, code_block in enumerate(content.code_blocks):
-            fragment_type = 'pseudocode' if self._is_pseudocode(code_block.code) else 'code'
-
+        for i, (code_block, block) in enumerate(zip(content.code_blocks, block_analyses)):
             fragments.append(CodeFragment(
                 content=code_block.code,
-                language=code_block.language,
-                fragment_type=fragment_type,
+                language=block.language,
+                fragment_type=block.fragment_type,
                 line_number=code_block.line_number or i
             ))
 
@@ -117,8 +202,87 @@ class CodeDetector:
 
         return blocks
 
-    def _is_pseudocode(self, code: str) -> bool:
-        """Check if code looks like pseudocode"""
-        code_lower = code.lower()
-        count = sum(1 for ind in self.PSEUDOCODE_INDICATORS if ind in code_lower)
-        return count >= 2
+
+def analyze_code(code: str, language: Optional[str] = None) -> CodeBlockAnalysis:
+    """
+    Work out a code block's fragment type, language, imports and whether
+    it looks like an algorithm, lowercasing and scanning it once.
+
+    Args:
+        code: Code block text
+        language: Language tag from the source document, if any
+
+    Returns:
+        CodeBlockAnalysis for the block
+    """
+    code_lower = code.lower()
+
+    if not language:
+        language = _infer_language(code)
+
+    # Collect names per pattern, then concatenate in pattern order; names
+    # keep their original case
+    if len(code_lower) == len(code):
+        matches = LIBRARY_PATTERN.finditer(code_lower)
+    else:
+        matches = LIBRARY_PATTERN_ANY_CASE.finditer(code)
+    found: List[List[str]] = [[] for _ in LIBRARY_PATTERNS]
+    for match in matches:
+        name = code[match.start(match.lastindex):match.end(match.lastindex)].split('.')[0].strip()
+        if len(name) > 1:
+            found[match.lastindex - 1].append(name)
+    imports = list(dict.fromkeys(name for names in found for name in names))
+
+    return CodeBlockAnalysis(
+        fragment_type=(
+            'pseudocode'
+            if _count_present(PSEUDOCODE_INDICATORS, code_lower) >= MIN_PSEUDOCODE_INDICATORS
+            else 'code'
+        ),
+        language=language,
+        imports=imports,
+        is_algorithmic=_count_present(ALGORITHMIC_KEYWORDS, code_lower) >= MIN_ALGORITHMIC_KEYWORDS
+    )
+
+
+def analyze_code_blocks(code_blocks: Iterable[Any], workers: int = 1) -> List[CodeBlockAnalysis]:
+    """
+    Analyze code blocks, across a process pool when there are many.
+
+    Args:
+        code_blocks: CodeBlock objects (anything with .code and .language)
+        workers: Maximum worker processes; 1 analyzes in-process
+
+    Returns:
+        One CodeBlockAnalysis per block, in order
+    """
+    items = [(block.code, block.language) for block in code_blocks]
+    if workers <= 1 or len(items) < PARALLEL_MIN_BLOCKS:
+        return [analyze_code(code, language) for code, language in items]
+
+    workers = min(workers, len(items))
+    chunk_size = max(1, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    logger.debug(f"Analyzing {len(items)} code blocks with {workers} workers")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_code_item, items, chunksize=chunk_size))
+
+
+def _analyze_code_item(item: Tuple[str, Optional[str]]) -> CodeBlockAnalysis:
+    """Pool entry point for analyze_code()"""
+    return analyze_code(*item)
+
+
+def _infer_language(code: str) -> Optional[str]:
+    """Language with the most indicators in the code, if it has enough"""
+    best, best_count = None, MIN_LANGUAGE_INDICATORS - 1
+    for language, indicators in LANGUAGE_INDICATORS.items():
+        count = _count_present(indicators, code)
+        if count > best_count:
+            best, best_count = language, count
+    return best
+
+
+def _count_present(keywords: Iterable[str], text: str) -> int:
+    """Number of keywords that occur in text"""
+    return sum(1 for keyword in keywords if keyword in text)
@@ -5,14 +5,30 @@ Analyzes extracted content to identify technical concepts, algorithms,
 architectures, and domain classification.
 """
 
+import bisect
 import logging
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from collections import Counter
 
+from .code_detector import CodeBlockAnalysis, analyze_code_blocks
+from .domain_classifier import DomainClassifier
+from .term_matcher import TermMatcher, TermScan
+
 logger = logging.getLogger(__name__)
 
+# Characters after an algorithm declaration searched for its steps
+STEP_WINDOW = 1000
+# Characters after a declaration searched for a complexity like O(n log n)
+COMPLEXITY_WINDOW = 500
+MAX_ALGORITHM_STEPS = 20
+
+# A numbered or bulleted list item on one line
+STEP_PATTERN = re.compile(r'^\s*(?:\d+[\.\)]\s+|[-*]\s+)(.+)$')
+# STEP_PATTERN for every line of a text at once; whitespace may not cross lines
+STEP_LINE_PATTERN = re.compile(r'^[^\S\n]*(?:\d+[\.\)][^\S\n]+|[-*][^\S\n]+).', re.MULTILINE)
+
 
 @dataclass
 class Algorithm:
@@ -106,12 +122,13 @@ class ContentAnalyzer:
         "client-server": ["client-server", "client/server", "server-client"],
     }
 
-    # Library/dependency patterns
-    LIBRARY_PATTERNS = [
-        (re.compile(r'\b(?:import|from|require|include)\s+([a-zA-Z_][\w.]*)', re.IGNORECASE), 1),
-        (re.compile(r'\b(?:using|with)\s+([a-zA-Z_][\w.]*)', re.IGNORECASE), 1),
-        (re.compile(r'\bpip install\s+([a-zA-Z_][\w-]*)', re.IGNORECASE), 1),
-        (re.compile(r'\bnpm install\s+([a-zA-Z_][\w-]*)', re.IGNORECASE), 1),
+    # Words that can open an explicit algorithm declaration (see algorithm_pattern)
+    ALGORITHM_DECLARATION_TERMS = ["algorithm", "procedure", "method"]
+
+    # Terms that indicate technical depth
+    TECHNICAL_TERMS = [
+        'algorithm', 'optimization', 'complexity', 'architecture',
+        'distributed', 'concurrent', 'asynchronous'
     ]
 
     def __init__(self):
@@ -122,35 +139,53 @@ class ContentAnalyzer:
         )
         self.complexity_pattern = re.compile(r'O\([^)]+\)', re.IGNORECASE)
 
-    def analyze(self, content: Any) -> AnalysisResult:
+        self.domain_classifier = DomainClassifier(self.DOMAIN_INDICATORS)
+
+        # One matcher for every keyword the detectors look for
+        terms = list(self.domain_classifier.terms)
+        terms += [keyword for keywords in self.ARCHITECTURE_PATTERNS.values() for keyword in keywords]
+        terms += self.TECHNICAL_TERMS
+        self.term_matcher = TermMatcher(terms, tracked=self.ALGORITHM_DECLARATION_TERMS)
+
+    def analyze(
+        self,
+        content: Any,
+        block_analyses: Optional[List[CodeBlockAnalysis]] = None
+    ) -> AnalysisResult:
         """
         Analyze extracted content for technical concepts.
 
         Args:
             content: ExtractedContent object from extractor
+            block_analyses: CodeDetector.analyze_code_blocks() result for
+                content.code_blocks (computed serially if not given)
 
         Returns:
             AnalysisResult with detected algorithms, architectures, etc.
         """
         logger.info("Analyzing content")
 
-        # Combine all text for analysis
-        full_text = self._combine_text(content)
+        # Find all keywords in one scan shared by the detectors below
+        scan = self._scan_text(content)
+
+        # Visit each code block once for the algorithm and dependency checks
+        if block_analyses is None:
+            block_analyses = analyze_code_blocks(content.code_blocks)
 
         # Detect algorithms
-        algorithms = self.detect_algorithms(content)
+        algorithms = self.detect_algorithms(content, scan, block_analyses)
 
         # Detect architectures
-        architectures = self._detect_architectures(full_text)
+        architectures = self._detect_architectures(scan)
 
         # Extract dependencies
-        dependencies = self._extract_dependencies(content)
+        dependencies = self._extract_dependencies(content, block_analyses)
 
         # Classify domain
-        domain = self.classify_domain(full_text)
+        domain, domain_probabilities = self._classify_scan(scan)
 
         # Assess complexity
-        complexity = self._assess_complexity(content)
+        complexity = self._assess_complexity(content, scan)
 
         # Calculate confidence
         confidence = self._calculate_confidence(algorithms, architectures, domain)
@@ -168,45 +203,58 @@ class ContentAnalyzer:
                 'num_algorithms': len(algorithms),
                 'num_architectures': len(architectures),
                 'num_dependencies': len(dependencies),
+                'domain_probabilities': {
+                    name: round(probability, 4) for name, probability in domain_probabilities.items()
+                },
             }
         )
 
-    def _combine_text(self, content: Any) -> str:
-        """Combine all text content for analysis"""
-        parts = [content.raw_text]
+    def _scan_text(self, content: Any) -> TermScan:
+        """Scan raw text, sections and code context for all keywords"""
+        def other_parts():
+            for section in content.sections:
+                yield section.heading
+                yield section.content
+            for code_block in content.code_blocks:
+                if code_block.context:
+                    yield code_block.context
 
-        # Add section content
-        for section in content.sections:
-            parts.append(section.heading)
-            parts.append(section.content)
+        return self.term_matcher.scan(content.raw_text, other_parts())
 
-        # Add code context
-        for code_block in content.code_blocks:
-            if code_block.context:
-                parts.append(code_block.context)
+    def detect_algorithms(
+        self,
+        content: Any,
+        scan: Optional[TermScan] = None,
+        block_analyses: Optional[List[CodeBlockAnalysis]] = None
+    ) -> List[Algorithm]:
+        """
+        Detect and extract algorithms from content.
 
-        return '\n'.join(parts).lower()
+        Args:
+            content: ExtractedContent object from extractor
+            scan: Keyword scan of the content; when given, declarations are
+                matched only where a declaration word was found
+            block_analyses: Per-code-block analysis, if already computed
 
-    def detect_algorithms(self, content: Any) -> List[Algorithm]:
-        """Detect and extract algorithms from content"""
+        Returns:
+            List of detected algorithms
+        """
         algorithms = []
 
         # Search in raw text
         text = content.raw_text
+        index = _AlgorithmTextIndex(text, self.complexity_pattern)
 
         # Method 1: Look for explicit algorithm declarations
-        for match in self.algorithm_pattern.finditer(text):
+        for match in self._find_declarations(text, scan):
             algo_num = match.group(1)
             algo_desc = match.group(2).strip()
 
             # Extract steps (look for numbered lists after the declaration)
-            steps = self._extract_algorithm_steps(text, match.end())
+            steps = self._extract_algorithm_steps(index, match.end())
 
             # Try to find complexity
-            complexity = None
-            complexity_match = self.complexity_pattern.search(text[match.start():match.end() + 500])
-            if complexity_match:
-                complexity = complexity_match.group(0)
+            complexity = index.complexity_near(match.start(), match.end() + COMPLEXITY_WINDOW)
 
             algorithms.append(Algorithm(
                 name=f"Algorithm {algo_num}" if algo_num else "Algorithm",
@@ -216,8 +264,10 @@ class ContentAnalyzer:
             ))
 
         # Method 2: Look in code blocks for algorithmic code
-        for code_block in content.code_blocks:
-            if self._is_algorithmic_code(code_block.code):
+        if block_analyses is None:
+            block_analyses = analyze_code_blocks(content.code_blocks)
+        for code_block, block in zip(content.code_blocks, block_analyses):
+            if block.is_algorithmic:
                 algorithms.append(Algorithm(
                     name=code_block.context[:50] if code_block.context else "Detected Algorithm",
                     description=code_block.context or "Algorithm from code",
@@ -228,57 +278,72 @@ class ContentAnalyzer:
         logger.debug(f"Detected {len(algorithms)} algorithms")
         return algorithms
 
-    def _extract_algorithm_steps(self, text: str, start_pos: int) -> List[str]:
-        """Extract numbered steps following an algorithm declaration"""
-        steps = []
-        lines = text[start_pos:start_pos + 1000].split('\n')
+    def _find_declarations(self, text: str, scan: Optional[TermScan]) -> Iterator[Any]:
+        """Yield algorithm_pattern matches, like finditer(text)"""
+        if scan is None or scan.positions is None:
+            yield from self.algorithm_pattern.finditer(text)
+            return
+
+        # Every match starts at a declaration word, so only those offsets need trying
+        starts = sorted(
+            position
+            for term in self.ALGORITHM_DECLARATION_TERMS
+            for position in scan.positions.get(term, ())
+        )
+        search_from = 0
+        for start in starts:
+            if start < search_from:
+                continue
+            match = self.algorithm_pattern.match(text, start)
+            if match:
+                yield match
+                search_from = match.end()
 
-        step_pattern = re.compile(r'^\s*(?:\d+[\.\)]\s+|[-*]\s+)(.+)$')
+    def _extract_algorithm_steps(self, index: '_AlgorithmTextIndex', start_pos: int) -> List[str]:
+        """
+        Extract numbered steps following an algorithm declaration.
 
-        for line in lines:
-            match = step_pattern.match(line)
+        Looks at the lines within STEP_WINDOW characters of start_pos. Lines
+        before the first list item are skipped by jumping straight to it;
+        the list then ends at a blank line or a line starting with a letter.
+        """
+        text = index.text
+        limit = min(len(text), start_pos + STEP_WINDOW)
+        line_start = index.next_step_line(start_pos)
+        if line_start is None or line_start >= limit:
+            return []
+
+        steps = []
+        while True:
+            newline = text.find('\n', line_start, limit)
+            line = text[line_start:limit if newline == -1 else newline]
+
+            match = STEP_PATTERN.match(line)
             if match:
                 steps.append(match.group(1).strip())
-            elif steps and line.strip() == '':
-                # Empty line might indicate end of steps
-                break
-            elif steps:
-                # Non-step line after steps started, might be end
-                if not line.strip():
-                    continue
-                if line[0].isalpha() and not line.strip().startswith('-'):
+                if len(steps) == MAX_ALGORITHM_STEPS:
                     break
+            elif steps and (not line.strip() or line[0].isalpha()):
+                # A blank line or plain text ends the list
+                break
 
-        return steps[:20]  # Max 20 steps
-
-    def _is_algorithmic_code(self, code: str) -> bool:
-        """Check if code looks like an algorithm implementation"""
-        code_lower = code.lower()
-
-        # Look for algorithmic patterns
-        patterns = [
-            'def ', 'function ', 'procedure',
-            'for ', 'while ', 'loop',
-            'if ', 'else', 'switch', 'case',
-            'return', 'yield'
-        ]
+            if newline == -1:
+                break
+            line_start = newline + 1
 
-        count = sum(1 for pattern in patterns if pattern in code_lower)
-        return count >= 3  # At least 3 algorithmic keywords
+        return steps
 
-    def _detect_architectures(self, text: str) -> List[Architecture]:
+    def _detect_architectures(self, scan: TermScan) -> List[Architecture]:
         """Detect architecture patterns"""
         architectures = []
 
         for arch_name, keywords in self.ARCHITECTURE_PATTERNS.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword in scan:
                     # Found architecture mention
-                    context = self._extract_context(text, keyword, 200)
-
                     architectures.append(Architecture(
                         name=arch_name.replace('_', ' ').title(),
-                        description=context,
+                        description=scan.contexts[keyword],
                         components=[],
                         relationships=[]
                     ))
@@ -287,29 +352,24 @@ class ContentAnalyzer:
         logger.debug(f"Detected {len(architectures)} architectures")
         return architectures
 
-    def _extract_context(self, text: str, keyword: str, window: int = 200) -> str:
-        """Extract context around a keyword"""
-        pos = text.index(keyword)
-        start = max(0, pos - window // 2)
-        end = min(len(text), pos + len(keyword) + window // 2)
-        return text[start:end].strip()
-
-    def _extract_dependencies(self, content: Any) -> List[Dependency]:
+    def _extract_dependencies(
+        self,
+        content: Any,
+        block_analyses: Optional[List[CodeBlockAnalysis]] = None
+    ) -> List[Dependency]:
         """Extract dependencies from code and text"""
         dependencies = {}
 
         # Extract from code blocks
-        for code_block in content.code_blocks:
-            for pattern, group_num in self.LIBRARY_PATTERNS:
-                matches = pattern.findall(code_block.code)
-                for match in matches:
-                    lib_name = match.split('.')[0].strip()
-                    if lib_name and len(lib_name) > 1:
-                        dependencies[lib_name] = Dependency(
-                            name=lib_name,
-                            version=None,
-                            purpose='Detected from imports'
-                        )
+        if block_analyses is None:
+            block_analyses = analyze_code_blocks(content.code_blocks)
+        for block in block_analyses:
+            for lib_name in block.imports:
+                dependencies[lib_name] = Dependency(
+                    name=lib_name,
+                    version=None,
+                    purpose='Detected from imports'
+                )
 
         # Extract from notebook metadata if available
         if 'dependencies' in content.metadata:
@@ -326,32 +386,22 @@ class ContentAnalyzer:
 
     def classify_domain(self, text: str) -> str:
         """
-        Classify content domain based on keywords.
+        Classify content domain based on keyword frequencies.
 
         Args:
-            text: Text content (should be lowercase)
+            text: Text content
 
         Returns:
             Domain name
         """
-        scores = {domain: 0 for domain in self.DOMAIN_INDICATORS}
-
-        # Count keyword occurrences
-        for domain, keywords in self.DOMAIN_INDICATORS.items():
-            for keyword in keywords:
-                if keyword in text:
-                    scores[domain] += 1
+        domain, _ = self._classify_scan(self.term_matcher.scan(text))
+        return domain
 
-        # Find highest scoring domain
-        if max(scores.values()) > 0:
-            domain = max(scores, key=scores.get)
-            logger.debug(f"Classified as {domain} (score: {scores[domain]})")
-            return domain
+    def _classify_scan(self, scan: TermScan) -> Tuple[str, Dict[str, float]]:
+        """Classify domain from whole-word keyword counts, with probabilities"""
+        return self.domain_classifier.classify(scan.word_counts)
 
-        # Default to general programming
-        return "general_programming"
-
-    def _assess_complexity(self, content: Any) -> str:
+    def _assess_complexity(self, content: Any, scan: TermScan) -> str:
         """Assess content complexity"""
         # Simple heuristics
         score = 0
@@ -374,13 +424,8 @@ class ContentAnalyzer:
         elif len(content.raw_text) > 5000:
             score += 1
 
-        # Technical terms indicate complexity
-        technical_terms = [
-            'algorithm', 'optimization', 'complexity', 'architecture',
-            'distributed', 'concurrent', 'asynchronous'
-        ]
-        text_lower = content.raw_text.lower()
-        score += sum(1 for term in technical_terms if term in text_lower)
+        # Technical terms in the main text indicate complexity
+        score += sum(1 for term in self.TECHNICAL_TERMS if scan.primary_counts[term])
 
         # Classify
         if score >= 6:
@@ -410,3 +455,43 @@ class ContentAnalyzer:
             confidence += 0.2
 
         return min(1.0, confidence)
+
+
+class _AlgorithmTextIndex:
+    """
+    Offsets shared by all algorithm declarations in one text.
+
+    List-item lines and complexity expressions are located with one scan of
+    the whole text each (on first use), so handling a declaration costs a
+    binary search instead of re-reading the text that follows it.
+    """
+
+    def __init__(self, text: str, complexity_pattern: re.Pattern):
+        self.text = text
+        self.complexity_pattern = complexity_pattern
+        self._step_lines: Optional[List[int]] = None
+        self._complexity_starts: Optional[List[int]] = None
+        self._complexity_matches: List[Any] = []
+
+    def next_step_line(self, position: int) -> Optional[int]:
+        """Start of the first list-item line beginning at or after position"""
+        if self._step_lines is None:
+            self._step_lines = [match.start() for match in STEP_LINE_PATTERN.finditer(self.text)]
+        i = bisect.bisect_left(self._step_lines, position)
+        return self._step_lines[i] if i < len(self._step_lines) else None
+
+    def complexity_near(self, start: int, end: int) -> Optional[str]:
+        """First complexity expression within text[start:end]"""
+        if self._complexity_starts is None:
+            self._complexity_matches = list(self.complexity_pattern.finditer(self.text))
+            self._complexity_starts = [match.start() for match in self._complexity_matches]
+
+        i = bisect.bisect_left(self._complexity_starts, start)
+        if i > 0 and self._complexity_matches[i - 1].end() > start:
+            # start falls inside an earlier match, which a search beginning
+            # at start would not see whole; search the window directly
+            match = self.complexity_pattern.search(self.text, start, end)
+            return match.group(0) if match else None
+        if i < len(self._complexity_matches) and self._complexity_matches[i].end() <= end:
+            return self._complexity_matches[i].group(0)
+        return None
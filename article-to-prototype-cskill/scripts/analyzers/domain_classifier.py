@@ -0,0 +1,125 @@
+"""
+Domain Classifier
+
+Scores content domains from keyword frequencies with a precomputed
+keyword-by-domain weight matrix, so classification costs one matrix
+product however many domains and keywords are configured.
+"""
+
+import logging
+import math
+from typing import Dict, List, Mapping, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# Domain reported when no domain has enough evidence
+DEFAULT_DOMAIN = "general_programming"
+
+# Score given to DEFAULT_DOMAIN: one mention of a keyword unique to a
+# domain (log1p(1) ~ 0.69) is enough to beat it
+DEFAULT_DOMAIN_SCORE = 0.5
+
+# Softmax temperature; lower values make probabilities more peaked
+SCORE_TEMPERATURE = 1.0
+
+
+class DomainClassifier:
+    """Weighted, frequency-aware keyword classifier"""
+
+    def __init__(self, indicators: Mapping[str, List[str]]):
+        """
+        Initialize domain classifier.
+
+        A keyword listed under several domains is split evenly between
+        them, so shared words like "optimization" count for less than
+        distinctive ones like "kubernetes".
+
+        Args:
+            indicators: Domain name -> keywords (lowercase)
+        """
+        self.domains = list(indicators)
+        self.terms = sorted({keyword for keywords in indicators.values() for keyword in keywords})
+
+        # term -> [(domain index, weight)]
+        self.term_weights: Dict[str, List[Tuple[int, float]]] = {term: [] for term in self.terms}
+        for domain_index, domain in enumerate(self.domains):
+            for keyword in set(indicators[domain]):
+                self.term_weights[keyword].append((domain_index, 1.0))
+        for term, weights in self.term_weights.items():
+            self.term_weights[term] = [(index, weight / len(weights)) for index, weight in weights]
+
+        if HAS_NUMPY:
+            self.weights = np.zeros((len(self.terms), len(self.domains)))
+            for row, term in enumerate(self.terms):
+                for domain_index, weight in self.term_weights[term]:
+                    self.weights[row, domain_index] = weight
+
+    def scores(self, counts: Mapping[str, int]) -> List[float]:
+        """
+        Score every domain.
+
+        Each keyword contributes log(1 + occurrences) times its weight, so
+        repeating one word has diminishing returns compared to mentioning
+        several different keywords.
+
+        Args:
+            counts: Keyword -> number of occurrences
+
+        Returns:
+            Scores in the order of self.domains
+        """
+        if HAS_NUMPY:
+            frequencies = np.fromiter(
+                (counts.get(term, 0) for term in self.terms), dtype=float, count=len(self.terms)
+            )
+            return (np.log1p(frequencies) @ self.weights).tolist()
+
+        scores = [0.0] * len(self.domains)
+        for term, weights in self.term_weights.items():
+            count = counts.get(term, 0)
+            if count:
+                frequency = math.log1p(count)
+                for domain_index, weight in weights:
+                    scores[domain_index] += weight * frequency
+        return scores
+
+    def probabilities(self, counts: Mapping[str, int]) -> Dict[str, float]:
+        """
+        Probability of each domain, including DEFAULT_DOMAIN.
+
+        Args:
+            counts: Keyword -> number of occurrences
+
+        Returns:
+            Domain -> probability (softmax over scores), summing to 1
+        """
+        names = self.domains + [DEFAULT_DOMAIN]
+        scores = self.scores(counts) + [DEFAULT_DOMAIN_SCORE]
+
+        top = max(scores)
+        exponentials = [math.exp((score - top) / SCORE_TEMPERATURE) for score in scores]
+        total = sum(exponentials)
+        return {name: value / total for name, value in zip(names, exponentials)}
+
+    def classify(self, counts: Mapping[str, int]) -> Tuple[str, Dict[str, float]]:
+        """
+        Pick the most probable domain.
+
+        Ties go to the domain listed first.
+
+        Args:
+            counts: Keyword -> number of occurrences
+
+        Returns:
+            Tuple of (domain, probabilities)
+        """
+        probabilities = self.probabilities(counts)
+        domain = max(probabilities, key=probabilities.get)
+        logger.debug(f"Classified as {domain} (p={probabilities[domain]:.2f})")
+        return domain, probabilities
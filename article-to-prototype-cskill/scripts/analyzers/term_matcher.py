@@ -0,0 +1,204 @@
+"""
+Term Matcher
+
+Finds every occurrence of a fixed vocabulary of keywords (domain,
+architecture, technical and algorithm terms) in one scan per text, so the
+content analyzer's detectors can share a single result instead of each
+searching the document again.
+"""
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Characters of context kept around the first occurrence of each term
+DEFAULT_CONTEXT_WINDOW = 200
+
+# Plural endings still counted as a whole-word match ("models", "processes")
+WORD_SUFFIXES = ('', 's', 'es')
+
+
+@dataclass
+class TermScan:
+    """Term occurrences gathered from one document"""
+    counts: Counter = field(default_factory=Counter)  # all text
+    word_counts: Counter = field(default_factory=Counter)  # all text, whole words only
+    primary_counts: Counter = field(default_factory=Counter)  # primary text only
+    # Offsets of tracked terms in the primary text; None when lowercasing
+    # changed the text's length, which would shift every offset
+    positions: Optional[Dict[str, List[int]]] = field(default_factory=dict)
+    contexts: Dict[str, str] = field(default_factory=dict)  # lowercased, around first occurrence
+
+    def __contains__(self, term: str) -> bool:
+        return self.counts[term] > 0
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Build a regex matching any of the terms, factored as a character trie.
+
+    Sibling branches start with different characters, so at most one is
+    viable at each step, and optional suffixes are greedy: a match is
+    always the longest term starting at that offset.
+    """
+    root: Dict[str, dict] = {}
+    for term in terms:
+        node = root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')' + ('?' if '' in node else '')
+
+    return build(root)
+
+
+class TermMatcher:
+    """Counts case-insensitive substring occurrences of a fixed set of terms"""
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        tracked: Iterable[str] = (),
+        context_window: int = DEFAULT_CONTEXT_WINDOW
+    ):
+        """
+        Initialize term matcher.
+
+        Args:
+            terms: Keywords to look for (matched case-insensitively)
+            tracked: Terms whose offsets in the primary text are recorded
+            context_window: Characters of context kept around each term
+        """
+        self.terms = sorted({term.lower() for term in terms} | {term.lower() for term in tracked})
+        self.tracked = frozenset(term.lower() for term in tracked)
+        self.context_window = context_window
+        self.pattern = re.compile(_trie_pattern(self.terms))
+
+        # A match reports the longest term at its offset; terms that are
+        # prefixes of it ("model" in "model-view-controller") start there too
+        self.implied = {
+            term: [other for other in self.terms if term.startswith(other)]
+            for term in self.terms
+        }
+
+    def scan(self, primary: str, others: Iterable[str] = ()) -> TermScan:
+        """
+        Scan a document's text once.
+
+        Occurrences may overlap, so counts match what per-keyword substring
+        tests would find; word_counts only keeps occurrences that are whole
+        words (optionally plural), so "rest" is not found in "interest".
+        Texts are lowercased one at a time rather than joined into a
+        combined copy; contexts are cut as if the texts were joined with
+        newlines.
+
+        Args:
+            primary: Main text (e.g. raw_text); tracked offsets refer to it
+            others: Additional texts such as headings and section bodies
+
+        Returns:
+            TermScan with counts, primary-text counts, offsets and contexts
+        """
+        result = TermScan()
+        texts = [primary]
+        texts.extend(others)
+        # term -> (text index, context within that text, chars missing left, right)
+        first_seen: Dict[str, Tuple[int, str, int, int]] = {}
+
+        for index, text in enumerate(texts):
+            self._scan_text(text, index, result, first_seen)
+
+        for term, (index, window, missing_left, missing_right) in first_seen.items():
+            if missing_left:
+                window = _spill_left(texts, index, missing_left) + window
+            if missing_right:
+                window += _spill_right(texts, index, missing_right)
+            result.contexts[term] = window.strip()
+
+        return result
+
+    def _scan_text(
+        self,
+        text: str,
+        index: int,
+        result: TermScan,
+        first_seen: Dict[str, Tuple[int, str, int, int]]
+    ) -> None:
+        primary = index == 0
+        lowered = text.lower()
+        if primary and len(lowered) != len(text):
+            result.positions = None
+        track = primary and bool(self.tracked) and result.positions is not None
+        half_window = self.context_window // 2
+        counts = result.counts
+
+        match = self.pattern.search(lowered)
+        while match:
+            start = match.start()
+            word_start = start == 0 or not _is_word_char(lowered[start - 1])
+            for term in self.implied[match.group()]:
+                counts[term] += 1
+                if word_start and _ends_word(lowered, start + len(term)):
+                    result.word_counts[term] += 1
+                if primary:
+                    result.primary_counts[term] += 1
+                if term not in first_seen:
+                    end = start + len(term)
+                    first_seen[term] = (
+                        index,
+                        lowered[max(0, start - half_window):end + half_window],
+                        max(0, half_window - start),
+                        max(0, end + half_window - len(lowered))
+                    )
+                if track and term in self.tracked:
+                    result.positions.setdefault(term, []).append(start)
+            match = self.pattern.search(lowered, start + 1)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _ends_word(text: str, end: int) -> bool:
+    """Whether a term ending at `end` ends a word (allowing a plural suffix)"""
+    for suffix in WORD_SUFFIXES:
+        if text.startswith(suffix, end):
+            after = end + len(suffix)
+            if after == len(text) or not _is_word_char(text[after]):
+                return True
+    return False
+
+
+def _spill_left(texts: List[str], index: int, size: int) -> str:
+    """Last `size` chars before texts[index] in '\\n'.join(texts), lowercased"""
+    pieces = []
+    length = 0
+    while index > 0 and length < size:
+        index -= 1
+        pieces.append('\n')
+        pieces.append(texts[index][-size:])
+        length += 1 + len(pieces[-1])
+    return ''.join(reversed(pieces))[-size:].lower()
+
+
+def _spill_right(texts: List[str], index: int, size: int) -> str:
+    """First `size` chars after texts[index] in '\\n'.join(texts), lowercased"""
+    pieces = []
+    length = 0
+    while index < len(texts) - 1 and length < size:
+        index += 1
+        pieces.append('\n')
+        pieces.append(texts[index][:size])
+        length += 1 + len(pieces[-1])
+    return ''.join(pieces)[:size].lower()
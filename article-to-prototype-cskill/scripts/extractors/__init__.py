@@ -8,10 +8,11 @@ Provides extractors for different content formats:
 - Markdown files
 """
 
-from .pdf_extractor import PDFExtractor, PDFExtractionError, ExtractedContent, Section, CodeBlock
+from .pdf_extractor import PDFExtractor, PDFDocument, PDFExtractionError, ExtractedContent, Section, CodeBlock
 
 __all__ = [
     'PDFExtractor',
+    'PDFDocument',
     'PDFExtractionError',
     'ExtractedContent',
     'Section',
@@ -0,0 +1,226 @@
+"""
+Extraction Cache
+
+Persists ExtractedContent on disk so unchanged documents are not parsed
+again. Entries are keyed by the SHA-256 of the document bytes plus the
+extractor name, its EXTRACTOR_VERSION and any output-affecting settings.
+Identical documents at different paths share an entry, so path-derived
+metadata is rewritten for the requesting path on every hit.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .pdf_extractor import ExtractedContent, Section, CodeBlock
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry format changes
+CACHE_FORMAT_VERSION = 2
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# JSON object keys tagging metadata values that JSON has no type for
+DATETIME_TAG = '__datetime__'
+DATE_TAG = '__date__'
+
+
+def default_cache_dir() -> str:
+    """Return the default cache location (honors XDG_CACHE_HOME)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return os.path.join(base, 'article-to-prototype', 'extractions')
+
+
+def hash_file(path: str) -> str:
+    """Return the hex SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_metadata(value: Any) -> Any:
+    """
+    Convert metadata to JSON data that decodes back to equal values.
+
+    Dates and datetimes (e.g. from YAML front matter) are tagged; any other
+    type JSON cannot represent exactly raises TypeError, so the entry is not
+    written rather than coming back with different types on a hit.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, datetime):
+        return {DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {DATE_TAG: value.isoformat()}
+    if isinstance(value, list):
+        return [_encode_metadata(item) for item in value]
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: _encode_metadata(item) for key, item in value.items()}
+    raise TypeError(f"metadata value of type {type(value).__name__} cannot be cached")
+
+
+def _decode_metadata(data: Dict[str, Any]) -> Any:
+    """json object_hook reversing _encode_metadata() tags"""
+    if len(data) == 1:
+        if DATETIME_TAG in data:
+            return datetime.fromisoformat(data[DATETIME_TAG])
+        if DATE_TAG in data:
+            return date.fromisoformat(data[DATE_TAG])
+    return data
+
+
+def _section_to_dict(section: Section) -> Dict[str, Any]:
+    return {
+        'heading': section.heading,
+        'level': section.level,
+        'content': section.content,
+        'line_number': section.line_number,
+        'subsections': [_section_to_dict(sub) for sub in section.subsections],
+    }
+
+
+def _section_from_dict(data: Dict[str, Any]) -> Section:
+    return Section(
+        heading=data['heading'],
+        level=data['level'],
+        content=data['content'],
+        line_number=data['line_number'],
+        subsections=[_section_from_dict(sub) for sub in data['subsections']],
+    )
+
+
+def content_to_dict(content: ExtractedContent) -> Dict[str, Any]:
+    """Serialize ExtractedContent to JSON-compatible data"""
+    return {
+        'title': content.title,
+        'sections': [_section_to_dict(section) for section in content.sections],
+        'code_blocks': [
+            {
+                'language': block.language,
+                'code': block.code,
+                'line_number': block.line_number,
+                'context': block.context,
+            }
+            for block in content.code_blocks
+        ],
+        'metadata': _encode_metadata(content.metadata),
+        'source_url': content.source_url,
+        'extraction_date': content.extraction_date.isoformat(),
+        'raw_text': content.raw_text,
+    }
+
+
+def content_from_dict(data: Dict[str, Any]) -> ExtractedContent:
+    """Rebuild ExtractedContent from content_to_dict() output"""
+    return ExtractedContent(
+        title=data['title'],
+        sections=[_section_from_dict(section) for section in data['sections']],
+        code_blocks=[CodeBlock(**block) for block in data['code_blocks']],
+        metadata=data['metadata'],
+        source_url=data['source_url'],
+        extraction_date=datetime.fromisoformat(data['extraction_date']),
+        raw_text=data['raw_text'],
+    )
+
+
+class ExtractionCache:
+    """On-disk cache of extraction results keyed by document hash"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize extraction cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: default_cache_dir())
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+        self,
+        path: str,
+        extractor: Any,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Compute the cache key for a document and extractor.
+
+        Args:
+            path: Document path
+            extractor: Extractor instance that would process the document
+            settings: Extra output-affecting settings (JSON-serializable)
+
+        Returns:
+            Hex cache key
+        """
+        identity = json.dumps({
+            'format': CACHE_FORMAT_VERSION,
+            'document': hash_file(path),
+            'extractor': type(extractor).__name__,
+            'version': getattr(extractor, 'EXTRACTOR_VERSION', None),
+            'settings': settings or {},
+        }, sort_keys=True)
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str, path: Optional[str] = None) -> Optional[ExtractedContent]:
+        """
+        Look up a cached extraction.
+
+        Args:
+            key: Cache key from key()
+            path: Path of the requesting document; replaces the path-derived
+                metadata of whichever copy of the document was cached
+
+        Returns:
+            ExtractedContent, or None on a miss or unreadable entry
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                content = content_from_dict(json.load(f, object_hook=_decode_metadata))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {entry_path}: {e}")
+            self.misses += 1
+            return None
+
+        if path is not None:
+            if 'file_name' in content.metadata:
+                content.metadata['file_name'] = Path(path).name
+            if 'file_path' in content.metadata:
+                content.metadata['file_path'] = path
+
+        self.hits += 1
+        logger.debug(f"Extraction cache hit: {key}")
+        return content
+
+    def put(self, key: str, content: ExtractedContent) -> None:
+        """Store an extraction result (written atomically, failures are logged)"""
+        entry_path = self._entry_path(key)
+        try:
+            data = content_to_dict(content)
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write extraction cache entry: {e}")
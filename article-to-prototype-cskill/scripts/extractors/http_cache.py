@@ -0,0 +1,141 @@
+"""
+HTTP Cache
+
+Stores fetched web pages on disk together with their ETag and
+Last-Modified validators, so revisits can be made as conditional requests
+and skipped entirely when the server answers 304 Not Modified. The same
+entries back offline replay, where pages are served only from the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk entry format changes
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_dir() -> str:
+    """Return the default HTTP cache location (honors XDG_CACHE_HOME)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return os.path.join(base, 'article-to-prototype', 'http')
+
+
+@dataclass
+class CachedResponse:
+    """A cached page body and the validators needed to revalidate it"""
+    url: str
+    body: str
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: str
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that revalidate this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """On-disk cache of web page bodies keyed by URL"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize HTTP cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: default_cache_dir())
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def _entry_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached page.
+
+        Returns:
+            CachedResponse, or None on a miss or unreadable entry
+        """
+        entry_path = self._entry_path(url)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != CACHE_FORMAT_VERSION or data['url'] != url:
+                raise ValueError("stale entry format")
+            entry = CachedResponse(**data['response'])
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable HTTP cache entry {entry_path}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, url: str, body: str, headers: Mapping[str, Any]) -> Optional[CachedResponse]:
+        """
+        Store a fetched page (written atomically, failures are logged).
+
+        Responses marked 'Cache-Control: no-store' are not stored.
+
+        Args:
+            url: Requested URL
+            body: Decoded page body
+            headers: Response headers (case-insensitive mapping)
+
+        Returns:
+            The stored CachedResponse, or None if it was not stored
+        """
+        if 'no-store' in (headers.get('Cache-Control') or '').lower():
+            return None
+
+        entry = CachedResponse(
+            url=url,
+            body=body,
+            content_type=headers.get('Content-Type', ''),
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            fetched_at=datetime.now().isoformat()
+        )
+
+        entry_path = self._entry_path(url)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        'format': CACHE_FORMAT_VERSION,
+                        'url': url,
+                        'response': asdict(entry),
+                    }, f)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write HTTP cache entry: {e}")
+            return None
+
+        return entry
@@ -7,7 +7,7 @@ Parses markdown files and extracts structure and content.
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 try:
@@ -17,9 +17,16 @@ except ImportError:
     HAS_MISTUNE = False
 
 from .pdf_extractor import ExtractedContent, Section, CodeBlock
+from .frontmatter_parser import parse_frontmatter
 
 logger = logging.getLogger(__name__)
 
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+# Opening fence: 3+ backticks or tildes, then an optional info string
+# (backtick fences cannot have backticks in their info string)
+FENCE_OPEN_PATTERN = re.compile(r'^\s*(?:(`{3,})([^`]*)|(~{3,})(.*))$')
+CODE_BLOCK_PLACEHOLDER = '[code block]'
+
 
 class MarkdownExtractionError(Exception):
     """Raised when markdown extraction fails"""
@@ -29,13 +36,11 @@ class MarkdownExtractionError(Exception):
 class MarkdownExtractor:
     """Extracts content from markdown files"""
 
+    # Bump when extraction output changes (invalidates cached extractions)
+    EXTRACTOR_VERSION = "1.1.0"
+
     def __init__(self):
         """Initialize markdown extractor"""
-        self.code_fence_pattern = re.compile(
-            r'```(\w+)?\n(.*?)\n```',
-            re.DOTALL
-        )
-        self.heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
 
     def extract(self, markdown_path: str) -> ExtractedContent:
         """
@@ -56,23 +61,25 @@ class MarkdownExtractor:
 
         logger.info(f"Extracting markdown: {markdown_path}")
 
+        # Read once and extract YAML front matter if present (not through
+        # load_frontmatter's cache: each document is extracted once, and
+        # caching would keep every body alive for the whole run)
         try:
             with open(markdown_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                document = parse_frontmatter(f.read())
         except Exception as e:
             raise MarkdownExtractionError(f"Failed to read markdown: {e}")
 
-        # Extract YAML front matter if present
-        front_matter, content = self._extract_front_matter(content)
+        front_matter = dict(document.fields)
+        content = document.body
+        if document.present:
+            logger.debug(f"Extracted front matter: {front_matter}")
 
-        # Extract title
-        title = self._extract_title(content, front_matter)
-
-        # Extract code blocks
-        code_blocks = self.extract_code_blocks(content)
+        # Extract sections and code blocks in one pass
+        sections, code_blocks = self._tokenize(content)
 
-        # Extract sections
-        sections = self._extract_sections(content)
+        # Extract title
+        title = self._extract_title(content, front_matter, sections)
 
         # Build metadata
         metadata = {
@@ -97,77 +104,31 @@ class MarkdownExtractor:
 
     def _extract_front_matter(self, content: str) -> tuple[Dict[str, Any], str]:
         """Extract YAML front matter from markdown"""
-        front_matter = {}
-
-        # Check for YAML front matter (--- ... ---)
-        if content.startswith('---\n'):
-            try:
-                end_index = content.index('\n---\n', 4)
-                yaml_content = content[4:end_index]
-                content = content[end_index + 5:]
-
-                # Simple YAML parsing (key: value pairs)
-                for line in yaml_content.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        front_matter[key.strip()] = value.strip()
-
-                logger.debug(f"Extracted front matter: {front_matter}")
-
-            except ValueError:
-                # No closing ---, treat as regular content
-                pass
-
-        return front_matter, content
-
-    def _extract_title(self, content: str, front_matter: Dict[str, Any]) -> str:
+        document = parse_frontmatter(content)
+        return dict(document.fields), document.body
+
+    def _extract_title(
+        self,
+        content: str,
+        front_matter: Dict[str, Any],
+        sections: Optional[List[Section]] = None
+    ) -> str:
         """Extract title from markdown"""
         # Try front matter first
         if 'title' in front_matter:
             return front_matter['title']
 
         # Look for first # heading
-        match = self.heading_pattern.search(content)
-        if match:
-            return match.group(2).strip()
+        if sections is None:
+            sections, _ = self._tokenize(content)
+        if sections:
+            return sections[0].heading
 
         return "Untitled Document"
 
     def _extract_sections(self, content: str) -> List[Section]:
         """Extract sections based on headings"""
-        sections = []
-
-        # Find all headings
-        headings = list(self.heading_pattern.finditer(content))
-
-        for i, match in enumerate(headings):
-            heading_level = len(match.group(1))
-            heading_text = match.group(2).strip()
-            start_pos = match.end()
-
-            # Find content until next heading or end
-            if i + 1 < len(headings):
-                end_pos = headings[i + 1].start()
-            else:
-                end_pos = len(content)
-
-            section_content = content[start_pos:end_pos].strip()
-
-            # Remove code blocks from section content for cleaner reading
-            section_content_clean = self.code_fence_pattern.sub(
-                '[code block]',
-                section_content
-            )
-
-            sections.append(Section(
-                heading=heading_text,
-                level=heading_level,
-                content=section_content_clean,
-                line_number=content[:start_pos].count('\n'),
-                subsections=[]
-            ))
-
-        logger.debug(f"Found {len(sections)} sections")
+        sections, _ = self._tokenize(content)
         return sections
 
     def extract_code_blocks(self, content: str) -> List[CodeBlock]:
@@ -180,25 +141,96 @@ class MarkdownExtractor:
         Returns:
             List of CodeBlock objects
         """
-        code_blocks = []
+        _, code_blocks = self._tokenize(content)
+        return code_blocks
+
+    def _tokenize(self, content: str) -> Tuple[List[Section], List[CodeBlock]]:
+        """
+        Split markdown into sections and code blocks in a single line scan.
 
-        # Find all code fences
-        for i, match in enumerate(self.code_fence_pattern.finditer(content)):
-            language = match.group(1)  # Language annotation
-            code = match.group(2).strip()
+        A fence state machine tracks fenced code: a block opened by N
+        backticks (or tildes) closes only on a line of at least N of the
+        same character, so shorter or different fences inside it are
+        code, and '#' lines inside code are never headings. An unclosed
+        fence runs to the end of the document. In section content each
+        fenced block is replaced by '[code block]'.
 
-            # Get context (text before code block)
-            context_start = max(0, match.start() - 200)
-            context_text = content[context_start:match.start()]
-            # Get last line as context
-            context = context_text.split('\n')[-1].strip() if context_text else ''
+        Args:
+            content: Markdown content string (without front matter)
 
+        Returns:
+            Tuple of (sections, code_blocks)
+        """
+        sections: List[Section] = []
+        code_blocks: List[CodeBlock] = []
+
+        section_lines: List[str] = []
+        fence: Optional[str] = None
+        code_lines: List[str] = []
+        code_language: Optional[str] = None
+        code_start = 0
+        code_context = ''
+        last_text_line = ''
+
+        def close_section():
+            if sections:
+                sections[-1].content = '\n'.join(section_lines).strip()
+
+        def close_code_block():
             code_blocks.append(CodeBlock(
-                language=language,
-                code=code,
-                line_number=content[:match.start()].count('\n'),
-                context=context
+                language=code_language,
+                code='\n'.join(code_lines).strip(),
+                line_number=code_start,
+                context=code_context
             ))
 
-        logger.debug(f"Found {len(code_blocks)} code blocks")
-        return code_blocks
+        for line_number, line in enumerate(content.split('\n')):
+            stripped = line.strip()
+
+            if fence is not None:
+                # Inside a fenced block: only a long enough matching fence closes it
+                if stripped.startswith(fence) and not stripped.lstrip(fence[0]):
+                    close_code_block()
+                    fence = None
+                else:
+                    code_lines.append(line)
+                continue
+
+            first = stripped[:1]
+            if first == '`' or first == '~':
+                match = FENCE_OPEN_PATTERN.match(line)
+                if match:
+                    fence = match.group(1) or match.group(3)
+                    info = (match.group(2) if match.group(1) else match.group(4)).strip()
+                    code_language = info.split()[0] if info else None
+                    code_lines = []
+                    code_start = line_number
+                    code_context = last_text_line[:200]
+                    section_lines.append(CODE_BLOCK_PLACEHOLDER)
+                    continue
+
+            elif first == '#':
+                match = HEADING_PATTERN.match(line)
+                if match:
+                    close_section()
+                    section_lines = []
+                    sections.append(Section(
+                        heading=match.group(2).strip(),
+                        level=len(match.group(1)),
+                        content='',
+                        line_number=line_number,
+                        subsections=[]
+                    ))
+                    last_text_line = match.group(2).strip()
+                    continue
+
+            section_lines.append(line)
+            if stripped:
+                last_text_line = stripped
+
+        if fence is not None:
+            close_code_block()
+        close_section()
+
+        logger.debug(f"Found {len(sections)} sections and {len(code_blocks)} code blocks")
+        return sections, code_blocks
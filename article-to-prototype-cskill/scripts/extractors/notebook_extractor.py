@@ -17,10 +17,29 @@ try:
 except ImportError:
     HAS_NBFORMAT = False
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 from .pdf_extractor import ExtractedContent, Section, CodeBlock
 
 logger = logging.getLogger(__name__)
 
+# 'import X' / 'from X import Y' at the start of a line
+IMPORT_PATTERN = re.compile(
+    r'^\s*(?:from\s+(\S+)\s+)?import\s+(\S+)',
+    re.MULTILINE
+)
+
+# Notebooks at least this large are streamed (when ijson is installed)
+STREAMING_MIN_BYTES = 16 * 1024 * 1024
+
+# Only the first outputs of a code cell, and the start of their text, are used
+MAX_CONTEXT_OUTPUTS = 3
+OUTPUT_CONTEXT_CHARS = 100
+
 
 class NotebookExtractionError(Exception):
     """Raised when notebook extraction fails"""
@@ -30,11 +49,25 @@ class NotebookExtractionError(Exception):
 class NotebookExtractor:
     """Extracts content from Jupyter notebooks"""
 
-    def __init__(self):
-        """Initialize notebook extractor"""
+    # Bump when extraction output changes (invalidates cached extractions)
+    EXTRACTOR_VERSION = "1.0.0"
+
+    def __init__(self, streaming: Optional[bool] = None):
+        """
+        Initialize notebook extractor.
+
+        Args:
+            streaming: Parse notebooks incrementally with ijson, skipping
+                output payloads. None streams notebooks of at least
+                STREAMING_MIN_BYTES when ijson is installed.
+        """
         if not HAS_NBFORMAT:
             raise ImportError("nbformat not installed. Install with: pip install nbformat")
 
+        if streaming and not HAS_IJSON:
+            logger.warning("ijson not installed, notebooks will be read whole. Install with: pip install ijson")
+        self.streaming = streaming
+
     def extract(self, notebook_path: str) -> ExtractedContent:
         """
         Extract content from a Jupyter notebook.
@@ -57,39 +90,71 @@ class NotebookExtractor:
 
         logger.info(f"Extracting notebook: {notebook_path}")
 
+        if self._should_stream(path):
+            try:
+                return self._extract_streaming(notebook_path)
+            except _LegacyNotebook:
+                logger.info("Pre-v4 notebook, reading with nbformat")
+            except Exception as e:
+                raise NotebookExtractionError(f"Failed to read notebook: {e}")
+
         try:
             with open(notebook_path, 'r', encoding='utf-8') as f:
                 nb = nbformat.read(f, as_version=4)
         except Exception as e:
             raise NotebookExtractionError(f"Failed to read notebook: {e}")
 
-        # Extract title from metadata or first markdown cell
-        title = self._extract_title(nb)
+        return self._build_content(nb.cells, nb.metadata, notebook_path)
+
+    def _should_stream(self, path: Path) -> bool:
+        if not HAS_IJSON or self.streaming is False:
+            return False
+        return bool(self.streaming) or path.stat().st_size >= STREAMING_MIN_BYTES
 
-        # Extract sections from markdown cells
+    def _build_content(self, cells: Any, nb_metadata: Any, notebook_path: str) -> ExtractedContent:
+        """
+        Build ExtractedContent in one pass over the cells.
+
+        Args:
+            cells: Iterable of notebook cells (may be a lazy generator)
+            nb_metadata: Notebook-level metadata; for streamed notebooks
+                it is only complete once the cells are consumed
+            notebook_path: Path to the .ipynb file
+        """
+        # Collect sections, code blocks and imports in one pass over the cells
         sections = []
         code_blocks = []
         raw_text_parts = []
+        dependencies = set()
+        heading_title = None
+        num_cells = 0
 
-        for i, cell in enumerate(nb.cells):
+        for i, cell in enumerate(cells):
+            num_cells += 1
             if cell.cell_type == 'markdown':
+                if heading_title is None:
+                    heading_title = self._first_heading(cell.source)
                 section = self._process_markdown_cell(cell, i)
                 if section:
                     sections.append(section)
                     raw_text_parts.append(f"## {section.heading}\n{section.content}")
 
             elif cell.cell_type == 'code':
+                self._collect_imports(cell.source, dependencies)
                 code_block = self._process_code_cell(cell, i)
                 if code_block:
                     code_blocks.append(code_block)
                     raw_text_parts.append(f"```python\n{code_block.code}\n```")
 
-        # Extract metadata
-        metadata = self._extract_metadata(nb, notebook_path)
+        # Title from metadata, then the first markdown heading
+        if 'title' in nb_metadata:
+            title = nb_metadata['title']
+        else:
+            title = heading_title or "Untitled Notebook"
 
-        # Extract dependencies from code cells
-        dependencies = self.extract_dependencies(notebook_path)
-        metadata['dependencies'] = dependencies
+        # Extract metadata
+        metadata = self._extract_metadata(nb_metadata, num_cells, notebook_path)
+        metadata['dependencies'] = sorted(dependencies)
 
         raw_text = '\n\n'.join(raw_text_parts)
 
@@ -105,6 +170,23 @@ class NotebookExtractor:
             raw_text=raw_text
         )
 
+    def _extract_streaming(self, notebook_path: str) -> ExtractedContent:
+        """Extract a notebook while streaming it with ijson"""
+        logger.debug("Streaming notebook with ijson")
+        reader = _StreamingNotebookReader()
+        with open(notebook_path, 'rb') as f:
+            return self._build_content(reader.cells(f), reader.metadata, notebook_path)
+
+    @staticmethod
+    def _first_heading(source: str) -> Optional[str]:
+        """Return the first non-empty '#' heading in markdown source"""
+        for line in source.split('\n'):
+            if line.startswith('#'):
+                title = line.lstrip('#').strip()
+                if title:
+                    return title
+        return None
+
     def _extract_title(self, nb: Any) -> str:
         """Extract title from notebook"""
         # Try metadata first
@@ -114,12 +196,9 @@ class NotebookExtractor:
         # Look for title in first markdown cell
         for cell in nb.cells:
             if cell.cell_type == 'markdown':
-                lines = cell.source.split('\n')
-                for line in lines:
-                    if line.startswith('#'):
-                        title = line.lstrip('#').strip()
-                        if title:
-                            return title
+                title = self._first_heading(cell.source)
+                if title:
+                    return title
 
         return "Untitled Notebook"
 
@@ -187,25 +266,29 @@ class NotebookExtractor:
             context=context
         )
 
-    def _extract_metadata(self, nb: Any, notebook_path: str) -> Dict[str, Any]:
+    def _extract_metadata(
+        self,
+        nb_metadata: Any,
+        num_cells: int,
+        notebook_path: str
+    ) -> Dict[str, Any]:
         """Extract notebook metadata"""
         metadata = {
             'file_name': Path(notebook_path).name,
             'file_path': notebook_path,
-            'num_cells': len(nb.cells) if hasattr(nb, 'cells') else 0,
+            'num_cells': num_cells,
         }
 
         # Extract kernel info
-        if hasattr(nb, 'metadata'):
-            if 'kernelspec' in nb.metadata:
-                kernel = nb.metadata['kernelspec']
-                metadata['kernel_name'] = kernel.get('name', 'unknown')
-                metadata['kernel_display_name'] = kernel.get('display_name', 'unknown')
+        if 'kernelspec' in nb_metadata:
+            kernel = nb_metadata['kernelspec']
+            metadata['kernel_name'] = kernel.get('name', 'unknown')
+            metadata['kernel_display_name'] = kernel.get('display_name', 'unknown')
 
-            if 'language_info' in nb.metadata:
-                lang_info = nb.metadata['language_info']
-                metadata['language'] = lang_info.get('name', 'unknown')
-                metadata['language_version'] = lang_info.get('version', 'unknown')
+        if 'language_info' in nb_metadata:
+            lang_info = nb_metadata['language_info']
+            metadata['language'] = lang_info.get('name', 'unknown')
+            metadata['language_version'] = lang_info.get('version', 'unknown')
 
         return metadata
 
@@ -232,20 +315,141 @@ class NotebookExtractor:
             return []
 
         dependencies = set()
-        import_pattern = re.compile(
-            r'^\s*(?:from\s+(\S+)\s+)?import\s+(\S+)',
-            re.MULTILINE
-        )
-
         for cell in nb.cells:
             if cell.cell_type == 'code':
-                matches = import_pattern.findall(cell.source)
-                for match in matches:
-                    # match[0] is 'from X', match[1] is 'import Y'
-                    dep = match[0] if match[0] else match[1]
-                    # Get root package name
-                    root_dep = dep.split('.')[0]
-                    dependencies.add(root_dep)
+                self._collect_imports(cell.source, dependencies)
 
         logger.debug(f"Extracted dependencies: {dependencies}")
         return sorted(list(dependencies))
+
+    @staticmethod
+    def _collect_imports(source: str, dependencies: set) -> None:
+        """Add the root package of every import in source to dependencies"""
+        for match in IMPORT_PATTERN.findall(source):
+            # match[0] is 'from X', match[1] is 'import Y'
+            dep = match[0] if match[0] else match[1]
+            # Get root package name
+            dependencies.add(dep.split('.')[0])
+
+
+class _LegacyNotebook(Exception):
+    """Raised by the streaming reader for notebooks older than nbformat 4"""
+    pass
+
+
+class _StreamingNotebookReader:
+    """
+    Incremental nbformat 4 reader built on ijson parse events.
+
+    Cells are yielded one at a time as NotebookNodes holding only what the
+    extractor uses: cell type, source, the 'language' cell metadata and the
+    leading text of the first MAX_CONTEXT_OUTPUTS outputs. Everything else,
+    including image and HTML payloads, is discarded as soon as the parser
+    emits it, so memory does not grow with output size. Notebook metadata
+    follows the cells in the file and is filled in once they are consumed.
+    """
+
+    # Notebook-level metadata kept for title and kernel info
+    METADATA_PREFIXES = {
+        'metadata.title': ('title', None),
+        'metadata.kernelspec.name': ('kernelspec', 'name'),
+        'metadata.kernelspec.display_name': ('kernelspec', 'display_name'),
+        'metadata.language_info.name': ('language_info', 'name'),
+        'metadata.language_info.version': ('language_info', 'version'),
+    }
+    SCALAR_EVENTS = frozenset({'string', 'number', 'boolean', 'null'})
+
+    def __init__(self):
+        self.metadata: Dict[str, Any] = {}
+
+    def cells(self, f: Any):
+        """
+        Yield cells from a binary notebook file.
+
+        Raises:
+            _LegacyNotebook: If the notebook uses a pre-v4 layout
+        """
+        cell = None
+        output = None
+        outputs_seen = 0
+
+        for prefix, event, value in ijson.parse(f):
+            if cell is not None:
+                if prefix == 'cells.item' and event == 'end_map':
+                    yield self._finish_cell(cell)
+                    cell = None
+                elif prefix == 'cells.item.cell_type' and event == 'string':
+                    cell['cell_type'] = value
+                elif prefix == 'cells.item.source' or prefix == 'cells.item.source.item':
+                    if event == 'string':
+                        cell['source'].append(value)
+                elif prefix == 'cells.item.metadata.language' and event in self.SCALAR_EVENTS:
+                    cell['metadata']['language'] = value
+                elif prefix == 'cells.item.outputs.item':
+                    if event == 'start_map':
+                        outputs_seen += 1
+                        output = {} if outputs_seen <= MAX_CONTEXT_OUTPUTS else None
+                        if output is not None:
+                            cell['outputs'].append(output)
+                elif output is not None and event == 'string':
+                    if prefix in ('cells.item.outputs.item.text', 'cells.item.outputs.item.text.item'):
+                        self._append_text(output, 'text', value)
+                    elif prefix in (
+                        'cells.item.outputs.item.data.text/plain',
+                        'cells.item.outputs.item.data.text/plain.item'
+                    ):
+                        self._append_text(output, 'text/plain', value)
+                elif output is not None and event == 'start_array':
+                    # List-valued text starts out empty, as nbformat would join it
+                    if prefix == 'cells.item.outputs.item.text':
+                        output.setdefault('text', '')
+                    elif prefix == 'cells.item.outputs.item.data.text/plain':
+                        output.setdefault('text/plain', '')
+
+            elif prefix == 'cells.item' and event == 'start_map':
+                cell = {'cell_type': None, 'source': [], 'metadata': {}, 'outputs': []}
+                output = None
+                outputs_seen = 0
+
+            elif prefix in self.METADATA_PREFIXES and event in self.SCALAR_EVENTS:
+                key, subkey = self.METADATA_PREFIXES[prefix]
+                if subkey is None:
+                    self.metadata[key] = value
+                else:
+                    self.metadata.setdefault(key, {})[subkey] = value
+
+            elif prefix in ('metadata.kernelspec', 'metadata.language_info') and event == 'start_map':
+                self.metadata.setdefault(prefix.split('.', 1)[1], {})
+
+            elif prefix == 'nbformat' and event == 'number' and value < 4:
+                raise _LegacyNotebook()
+
+            elif prefix == 'worksheets':
+                raise _LegacyNotebook()
+
+    @staticmethod
+    def _append_text(output: Dict[str, str], key: str, value: str) -> None:
+        """Keep only the leading characters of an output's text"""
+        current = output.get(key, '')
+        if len(current) < OUTPUT_CONTEXT_CHARS:
+            output[key] = current + value[:OUTPUT_CONTEXT_CHARS - len(current)]
+
+    @staticmethod
+    def _finish_cell(cell: Dict[str, Any]) -> Any:
+        """Convert collected cell fields into a NotebookNode"""
+        node = {
+            'cell_type': cell['cell_type'],
+            'source': ''.join(cell['source']),
+            'metadata': cell['metadata'],
+        }
+        if cell['cell_type'] == 'code':
+            outputs = []
+            for output in cell['outputs']:
+                entry = {}
+                if 'text' in output:
+                    entry['text'] = output['text']
+                if 'text/plain' in output:
+                    entry['data'] = {'text/plain': output['text/plain']}
+                outputs.append(entry)
+            node['outputs'] = outputs
+        return nbformat.from_dict(node)
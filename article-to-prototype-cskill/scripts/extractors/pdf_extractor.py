@@ -7,8 +7,9 @@ Preserves code blocks, section structure, and handles various PDF formats.
 
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -26,6 +27,109 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Documents shorter than this are extracted serially (pool startup dominates)
+PARALLEL_MIN_PAGES = 8
+
+# Page ranges handed to each worker; several per worker balances uneven pages
+CHUNKS_PER_WORKER = 4
+
+# Line classifier: all heading rules and all code rules as one compiled
+# alternation each, so labelling a line costs one anchored match plus one
+# search. Code rules run on the lowercased line; case-insensitive matching
+# would disable the regex engine's literal prefix scan.
+HEADING_CLASSIFIER = re.compile(r"""
+    (?P<numbered>(?:\d+\.)+)\s+[A-Z]                           # 1.1. Title
+  | [A-Z][A-Z\s]+\Z                                              # ALL CAPS TITLE
+  | (?i:abstract|introduction|conclusion|references)\s*\Z        # Named sections
+""", re.VERBOSE)
+
+# Every branch starts with a literal or character class so the regex engine
+# can skip ahead to candidate positions; matched against the lowercased line
+CODE_CLASSIFIER = re.compile(r"""
+    [()\[\]{};]                                                   # Brackets and semicolons
+  | [=+\-*/][=+\-*/]                                              # Multiple operators
+  | algorithm|procedure|f(?:unction|or\()|def\ |class\ |i(?:mport\ |f\()|while\(
+""", re.VERBOSE)
+
+NUMBERED_STEP = re.compile(r'\d+[.)]\s')
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[Tuple[int, str]]:
+    """
+    Extract text from pages [start, end) in a worker process.
+
+    Each worker opens the PDF on its own; pdfplumber objects cannot be
+    shared across processes.
+
+    Returns:
+        List of (page_number, text) for pages that produced text (1-based)
+    """
+    pages = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(start, end):
+            page_num = index + 1
+            page = pdf.pages[index]
+            try:
+                text = page.extract_text()
+                if text:
+                    pages.append((page_num, text))
+            except Exception as e:
+                logger.warning(f"Failed to extract page {page_num}: {e}")
+            finally:
+                # Release cached layout objects between pages
+                page.close()
+    return pages
+
+
+def _pdfplumber_metadata(pdf: Any) -> Dict[str, Any]:
+    """Map pdfplumber document metadata to extractor metadata keys"""
+    if not pdf.metadata:
+        return {}
+    return {
+        'title': pdf.metadata.get('Title', ''),
+        'author': pdf.metadata.get('Author', ''),
+        'subject': pdf.metadata.get('Subject', ''),
+        'creator': pdf.metadata.get('Creator', ''),
+        'producer': pdf.metadata.get('Producer', ''),
+        'creation_date': pdf.metadata.get('CreationDate', ''),
+    }
+
+
+def _pypdf2_metadata(reader: Any) -> Dict[str, Any]:
+    """Map PyPDF2 document metadata to extractor metadata keys"""
+    if not reader.metadata:
+        return {}
+    return {
+        'title': reader.metadata.get('/Title', ''),
+        'author': reader.metadata.get('/Author', ''),
+        'subject': reader.metadata.get('/Subject', ''),
+        'creator': reader.metadata.get('/Creator', ''),
+        'producer': reader.metadata.get('/Producer', ''),
+    }
+
+
+def parse_page_range(spec: str) -> List[int]:
+    """
+    Parse a page selection such as "1-3,7" into 1-based page numbers.
+
+    Args:
+        spec: Comma-separated pages and inclusive ranges
+
+    Returns:
+        Sorted list of unique page numbers
+    """
+    pages = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-', 1)
+            pages.update(range(int(first), int(last) + 1))
+        else:
+            pages.add(int(part))
+    return sorted(pages)
+
 
 class PDFExtractionError(Exception):
     """Raised when PDF extraction fails"""
@@ -63,37 +167,157 @@ class ExtractedContent:
     raw_text: str
 
 
+class PDFDocument:
+    """
+    Lazy, random-access view of a PDF.
+
+    The page index and metadata are loaded when the document is opened;
+    page text is extracted only when requested and memoized per page, so
+    partial analyses only pay for the pages they touch.
+    """
+
+    def __init__(self, pdf_path: str, backend: Optional[str] = None):
+        """
+        Open a PDF document.
+
+        Args:
+            pdf_path: Path to the PDF file
+            backend: 'pdfplumber' or 'pypdf2' (default: best available)
+
+        Raises:
+            PDFExtractionError: If the document cannot be opened
+        """
+        if backend is None:
+            backend = 'pdfplumber' if HAS_PDFPLUMBER else 'pypdf2'
+        if (backend == 'pdfplumber' and not HAS_PDFPLUMBER) or (backend == 'pypdf2' and not HAS_PYPDF2):
+            raise PDFExtractionError(f"PDF backend not available: {backend}")
+
+        self.pdf_path = pdf_path
+        self.backend = backend
+        self._file = None
+        self._texts: Dict[int, str] = {}
+
+        try:
+            if backend == 'pdfplumber':
+                self._pdf = pdfplumber.open(pdf_path)
+                self.metadata = _pdfplumber_metadata(self._pdf)
+            else:
+                self._file = open(pdf_path, 'rb')
+                self._pdf = PyPDF2.PdfReader(self._file)
+                self.metadata = _pypdf2_metadata(self._pdf)
+            self.num_pages = len(self._pdf.pages)
+        except Exception as e:
+            self.close()
+            raise PDFExtractionError(f"{backend} failed to open PDF: {e}")
+
+    def __enter__(self) -> 'PDFDocument':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the underlying PDF handle"""
+        pdf = getattr(self, '_pdf', None)
+        if pdf is not None and hasattr(pdf, 'close'):
+            pdf.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def page_text(self, page_num: int) -> str:
+        """
+        Extract text of one page (memoized).
+
+        Args:
+            page_num: 1-based page number
+
+        Returns:
+            Page text ('' if the page has no extractable text)
+        """
+        if page_num in self._texts:
+            return self._texts[page_num]
+        if not 1 <= page_num <= self.num_pages:
+            raise IndexError(f"Page {page_num} out of range (1-{self.num_pages})")
+
+        page = self._pdf.pages[page_num - 1]
+        try:
+            text = page.extract_text() or ''
+            logger.debug(f"Extracted {len(text)} chars from page {page_num}")
+        except Exception as e:
+            logger.warning(f"Failed to extract page {page_num}: {e}")
+            text = ''
+        finally:
+            if self.backend == 'pdfplumber':
+                # Keep the text, drop cached layout objects
+                page.close()
+
+        self._texts[page_num] = text
+        return text
+
+    def iter_pages(self, pages: Optional[Union[Iterable[int], str]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page_number, text) for selected pages that have text.
+
+        Args:
+            pages: 1-based page numbers, a range, or a spec like "1-3,7"
+                (default: all pages); out-of-range pages are ignored
+
+        Yields:
+            Tuples of (page_number, text), extracted on demand
+        """
+        if pages is None:
+            selected = range(1, self.num_pages + 1)
+        elif isinstance(pages, str):
+            selected = parse_page_range(pages)
+        else:
+            selected = pages
+
+        for page_num in selected:
+            if not 1 <= page_num <= self.num_pages:
+                continue
+            text = self.page_text(page_num)
+            if text:
+                yield page_num, text
+
+
 class PDFExtractor:
     """Extracts content from PDF files with structure preservation"""
 
-    def __init__(self):
-        """Initialize PDF extractor"""
+    # Bump when extraction output changes (invalidates cached extractions)
+    EXTRACTOR_VERSION = "1.0.0"
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize PDF extractor.
+
+        Args:
+            workers: Processes used for pdfplumber page extraction
+                (default: None, extract serially; parallel extraction is
+                opt-in since pool startup outweighs it on small PDFs)
+        """
         if not HAS_PDFPLUMBER and not HAS_PYPDF2:
             raise ImportError(
                 "Neither pdfplumber nor PyPDF2 is installed. "
                 "Install with: pip install pdfplumber PyPDF2"
             )
 
-        self.heading_patterns = [
-            re.compile(r'^(\d+\.)+\s+[A-Z]'),  # 1.1 Title
-            re.compile(r'^[A-Z][A-Z\s]+$'),     # ALL CAPS TITLE
-            re.compile(r'^Abstract\s*$', re.IGNORECASE),
-            re.compile(r'^Introduction\s*$', re.IGNORECASE),
-            re.compile(r'^Conclusion\s*$', re.IGNORECASE),
-            re.compile(r'^References\s*$', re.IGNORECASE),
-        ]
-
-        self.code_indicators = [
-            'algorithm', 'procedure', 'function', 'def ', 'class ',
-            'import ', 'for(', 'while(', 'if(', '{', '}', ';'
-        ]
+        self.workers = workers or 1
 
-    def extract(self, pdf_path: str) -> ExtractedContent:
+    def extract(
+        self,
+        pdf_path: str,
+        pages: Optional[Union[Iterable[int], str]] = None,
+        until_sections: Optional[List[str]] = None
+    ) -> ExtractedContent:
         """
         Extract content from a PDF file.
 
         Args:
             pdf_path: Path to the PDF file
+            pages: Only extract these 1-based pages, e.g. range(1, 4) or "1-3,7"
+            until_sections: Stop reading pages once a section whose heading
+                contains each of these names (case-insensitive) is complete
 
         Returns:
             ExtractedContent object with structured data
@@ -102,15 +326,14 @@ class PDFExtractor:
             PDFExtractionError: If extraction fails
             FileNotFoundError: If PDF file doesn't exist
         """
-        path = Path(pdf_path)
-        if not path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-        if not path.suffix.lower() == '.pdf':
-            raise PDFExtractionError(f"Not a PDF file: {pdf_path}")
+        self._check_path(pdf_path)
 
         logger.info(f"Extracting content from PDF: {pdf_path}")
 
+        # Partial extraction reads pages lazily through a PDFDocument
+        if pages is not None or until_sections:
+            return self._extract_partial(pdf_path, pages, until_sections)
+
         # Try pdfplumber first (better layout analysis)
         if HAS_PDFPLUMBER:
             try:
@@ -127,130 +350,260 @@ class PDFExtractor:
 
         raise PDFExtractionError("No PDF library available for extraction")
 
+    def stream(self, pdf_path: str) -> Iterator[Union[Section, CodeBlock]]:
+        """
+        Extract sections and code blocks lazily, page by page.
+
+        Items are yielded as soon as they are complete, so the first sections
+        are available before the last page has been parsed, and no full-text
+        copy of the document is built.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Yields:
+            Section and CodeBlock objects in document order of completion
+
+        Raises:
+            PDFExtractionError: If extraction fails
+            FileNotFoundError: If PDF file doesn't exist
+        """
+        self._check_path(pdf_path)
+
+        if HAS_PDFPLUMBER:
+            pages = self._iter_pages_pdfplumber(pdf_path, {})
+        elif HAS_PYPDF2:
+            pages = self._iter_pages_pypdf2(pdf_path, {})
+        else:
+            raise PDFExtractionError("No PDF library available for extraction")
+
+        # Items are handed to the caller only, so memory stays bounded by the
+        # open section and code block rather than the whole document
+        processor = _LineStreamProcessor(self, collect=False)
+        for page_num, text in pages:
+            yield from processor.feed(self._page_lines(page_num, text))
+        yield from processor.finish()
+
+    def open(self, pdf_path: str) -> PDFDocument:
+        """
+        Open a PDF as a lazy, random-access document.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            PDFDocument (use as a context manager to close it)
+        """
+        self._check_path(pdf_path)
+        return PDFDocument(pdf_path)
+
+    def _extract_partial(
+        self,
+        pdf_path: str,
+        pages: Optional[Union[Iterable[int], str]],
+        until_sections: Optional[List[str]]
+    ) -> ExtractedContent:
+        """Extract selected pages, stopping early once requested sections are found"""
+        backends = [name for name, available in (('pdfplumber', HAS_PDFPLUMBER), ('pypdf2', HAS_PYPDF2)) if available]
+        if not backends:
+            raise PDFExtractionError("No PDF library available for extraction")
+
+        for backend in backends:
+            try:
+                with PDFDocument(pdf_path, backend) as document:
+                    return self._process_page_stream(
+                        document.iter_pages(pages),
+                        document.metadata,
+                        pdf_path,
+                        until_sections=until_sections
+                    )
+            except Exception as e:
+                if backend == backends[-1]:
+                    raise
+                logger.warning(f"{backend} extraction failed: {e}, trying PyPDF2")
+
+    def _check_path(self, pdf_path: str) -> None:
+        """Validate that the path exists and is a PDF"""
+        path = Path(pdf_path)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        if not path.suffix.lower() == '.pdf':
+            raise PDFExtractionError(f"Not a PDF file: {pdf_path}")
+
     def _extract_with_pdfplumber(self, pdf_path: str) -> ExtractedContent:
         """Extract using pdfplumber (preferred method)"""
         logger.debug("Using pdfplumber for extraction")
 
-        text_content = []
         metadata = {}
+        pages = self._iter_pages_pdfplumber(pdf_path, metadata)
+        return self._process_page_stream(pages, metadata, pdf_path)
+
+    def _iter_pages_pdfplumber(self, pdf_path: str, metadata: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page_number, text) for each page with text, using pdfplumber.
 
+        Fills 'metadata' in place once the document is opened.
+        """
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 # Extract metadata
-                if pdf.metadata:
-                    metadata = {
-                        'title': pdf.metadata.get('Title', ''),
-                        'author': pdf.metadata.get('Author', ''),
-                        'subject': pdf.metadata.get('Subject', ''),
-                        'creator': pdf.metadata.get('Creator', ''),
-                        'producer': pdf.metadata.get('Producer', ''),
-                        'creation_date': pdf.metadata.get('CreationDate', ''),
-                    }
-
-                # Extract text from all pages
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        text = page.extract_text()
+                metadata.update(_pdfplumber_metadata(pdf))
+
+                num_pages = len(pdf.pages)
+                parallel = self.workers > 1 and num_pages >= PARALLEL_MIN_PAGES
+
+                if not parallel:
+                    for page_num, page in enumerate(pdf.pages, 1):
+                        try:
+                            text = page.extract_text()
+                        except Exception as e:
+                            logger.warning(f"Failed to extract page {page_num}: {e}")
+                            continue
+                        finally:
+                            # Release cached layout objects between pages
+                            page.close()
                         if text:
-                            text_content.append(f"\n--- Page {page_num} ---\n{text}")
                             logger.debug(f"Extracted {len(text)} chars from page {page_num}")
-                    except Exception as e:
-                        logger.warning(f"Failed to extract page {page_num}: {e}")
-                        continue
+                            yield page_num, text
 
+            # Layout analysis is CPU-bound: fan page ranges out to processes
+            if parallel:
+                yield from self._extract_pages_parallel(pdf_path, num_pages)
+
+        except PDFExtractionError:
+            raise
         except Exception as e:
             raise PDFExtractionError(f"pdfplumber extraction failed: {e}")
 
-        if not text_content:
-            raise PDFExtractionError("No text content extracted from PDF")
+    def _extract_pages_parallel(self, pdf_path: str, num_pages: int) -> Iterator[Tuple[int, str]]:
+        """
+        Extract pages across a process pool, yielding them in page order.
 
-        raw_text = '\n'.join(text_content)
-        logger.info(f"Extracted {len(raw_text)} characters from PDF")
+        Args:
+            pdf_path: Path to the PDF file
+            num_pages: Total number of pages
+
+        Yields:
+            Tuples of (page_number, text)
+        """
+        workers = min(self.workers, num_pages)
+        chunk_size = max(1, -(-num_pages // (workers * CHUNKS_PER_WORKER)))
+        starts = range(0, num_pages, chunk_size)
+        ends = [min(start + chunk_size, num_pages) for start in starts]
 
-        # Process extracted text
-        return self._process_extracted_text(raw_text, metadata, pdf_path)
+        logger.debug(f"Extracting {num_pages} pages with {workers} workers in {len(starts)} chunks")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields chunks in submission order as soon as each is ready
+            for pages in executor.map(_extract_page_range, [pdf_path] * len(starts), starts, ends):
+                for page_num, text in pages:
+                    logger.debug(f"Extracted {len(text)} chars from page {page_num}")
+                    yield page_num, text
 
     def _extract_with_pypdf2(self, pdf_path: str) -> ExtractedContent:
         """Extract using PyPDF2 (fallback method)"""
         logger.debug("Using PyPDF2 for extraction")
 
-        text_content = []
         metadata = {}
+        pages = self._iter_pages_pypdf2(pdf_path, metadata)
+        return self._process_page_stream(pages, metadata, pdf_path)
+
+    def _iter_pages_pypdf2(self, pdf_path: str, metadata: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (page_number, text) for each page with text, using PyPDF2.
 
+        Fills 'metadata' in place once the document is opened.
+        """
         try:
             with open(pdf_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
 
                 # Extract metadata
-                if reader.metadata:
-                    metadata = {
-                        'title': reader.metadata.get('/Title', ''),
-                        'author': reader.metadata.get('/Author', ''),
-                        'subject': reader.metadata.get('/Subject', ''),
-                        'creator': reader.metadata.get('/Creator', ''),
-                        'producer': reader.metadata.get('/Producer', ''),
-                    }
+                metadata.update(_pypdf2_metadata(reader))
 
                 # Extract text from all pages
                 for page_num, page in enumerate(reader.pages, 1):
                     try:
                         text = page.extract_text()
-                        if text:
-                            text_content.append(f"\n--- Page {page_num} ---\n{text}")
-                            logger.debug(f"Extracted {len(text)} chars from page {page_num}")
                     except Exception as e:
                         logger.warning(f"Failed to extract page {page_num}: {e}")
                         continue
+                    if text:
+                        logger.debug(f"Extracted {len(text)} chars from page {page_num}")
+                        yield page_num, text
 
         except Exception as e:
             raise PDFExtractionError(f"PyPDF2 extraction failed: {e}")
 
-        if not text_content:
-            raise PDFExtractionError("No text content extracted from PDF")
-
-        raw_text = '\n'.join(text_content)
-        logger.info(f"Extracted {len(raw_text)} characters from PDF")
+    @staticmethod
+    def _page_lines(page_num: int, text: str) -> List[str]:
+        """Lines a page contributes to raw_text, including its page marker"""
+        return f"\n--- Page {page_num} ---\n{text}".split('\n')
 
-        # Process extracted text
-        return self._process_extracted_text(raw_text, metadata, pdf_path)
-
-    def _process_extracted_text(
+    def _process_page_stream(
         self,
-        raw_text: str,
+        pages: Iterable[Tuple[int, str]],
         metadata: Dict[str, Any],
-        pdf_path: str
+        pdf_path: str,
+        until_sections: Optional[List[str]] = None
     ) -> ExtractedContent:
-        """Process raw extracted text into structured content"""
-
-        # Extract title
-        title = self._extract_title(raw_text, metadata)
+        """
+        Build structured content from a page stream in a single pass.
 
-        # Extract sections
-        sections = self._extract_sections(raw_text)
+        Title, section and code-block detection run incrementally per line,
+        so the text is never re-split after extraction. With until_sections,
+        pages stop being consumed once every requested section is complete.
+        """
+        processor = _LineStreamProcessor(self)
+        raw_parts = []
+        wanted = {name.lower() for name in until_sections or []}
+
+        for page_num, text in pages:
+            lines = self._page_lines(page_num, text)
+            completed = processor.feed(lines)
+            raw_parts.append('\n'.join(lines))
+
+            if wanted:
+                for item in completed:
+                    if isinstance(item, Section):
+                        heading = item.heading.lower()
+                        wanted = {name for name in wanted if name not in heading}
+                if not wanted:
+                    logger.info(f"Found requested sections, stopping after page {page_num}")
+                    break
+
+        processor.finish()
+
+        if not raw_parts:
+            raise PDFExtractionError("No text content extracted from PDF")
 
-        # Extract code blocks
-        code_blocks = self._extract_code_blocks(raw_text)
+        raw_text = '\n'.join(raw_parts)
+        logger.info(f"Extracted {len(raw_text)} characters from PDF")
+        logger.info(f"Extracted {len(processor.sections)} sections")
+        logger.info(f"Extracted {len(processor.code_blocks)} code blocks")
 
         # Build metadata
         full_metadata = {
             **metadata,
             'file_name': Path(pdf_path).name,
             'file_path': pdf_path,
-            'num_sections': len(sections),
-            'num_code_blocks': len(code_blocks),
+            'num_sections': len(processor.sections),
+            'num_code_blocks': len(processor.code_blocks),
+            'pages_extracted': len(raw_parts),
         }
 
         return ExtractedContent(
-            title=title,
-            sections=sections,
-            code_blocks=code_blocks,
+            title=self._extract_title(processor.title_candidate, metadata),
+            sections=processor.sections,
+            code_blocks=processor.code_blocks,
             metadata=full_metadata,
             source_url=None,
             extraction_date=datetime.now(),
             raw_text=raw_text
         )
 
-    def _extract_title(self, text: str, metadata: Dict[str, Any]) -> str:
+    def _extract_title(self, candidate: Optional[str], metadata: Dict[str, Any]) -> str:
         """Extract document title"""
         # First, try metadata
         if metadata.get('title'):
@@ -259,58 +612,56 @@ class PDFExtractor:
                 logger.debug(f"Using title from metadata: {title}")
                 return title
 
-        # Try to find title in first few lines
-        lines = text.split('\n')
-        for i, line in enumerate(lines[:20]):  # Check first 20 lines
-            line = line.strip()
-            if len(line) > 10 and len(line) < 200:
-                # Likely a title if it's not too short or too long
-                if not line.startswith('---'):  # Skip page markers
-                    logger.debug(f"Using title from content: {line}")
-                    return line
+        # Otherwise use the first plausible line from the content
+        if candidate:
+            logger.debug(f"Using title from content: {candidate}")
+            return candidate
 
         # Fallback
         return "Untitled Document"
 
     def _extract_sections(self, text: str) -> List[Section]:
         """Extract document sections with headings"""
-        sections = []
-        lines = text.split('\n')
-        current_section = None
-        current_content = []
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
+        processor = _LineStreamProcessor(self)
+        processor.feed(text.split('\n'))
+        processor.finish()
+        return processor.sections
 
-            # Check if line is a heading
-            is_heading, level = self._is_heading(stripped)
+    def _classify_line(self, line: str, stripped: Optional[str] = None) -> Tuple[int, bool]:
+        """
+        Label a line as heading and/or code in one classifier pass.
 
-            if is_heading:
-                # Save previous section if exists
-                if current_section:
-                    current_section.content = '\n'.join(current_content).strip()
-                    sections.append(current_section)
+        Args:
+            line: Raw line (indentation counts as a code signal)
+            stripped: line.strip(), if already computed
 
-                # Start new section
-                current_section = Section(
-                    heading=stripped,
-                    level=level,
-                    content='',
-                    line_number=i,
-                    subsections=[]
-                )
-                current_content = []
-            elif current_section:
-                # Add content to current section
-                current_content.append(line)
+        Returns:
+            Tuple of (heading_level or 0, is_code)
+        """
+        if stripped is None:
+            stripped = line.strip()
 
-        # Save last section
-        if current_section:
-            current_section.content = '\n'.join(current_content).strip()
-            sections.append(current_section)
+        # Empty lines are neither headings nor code
+        if not stripped:
+            return 0, False
 
-        logger.info(f"Extracted {len(sections)} sections")
-        return sections
+        level = 0
+        if len(stripped) >= 3:
+            heading = HEADING_CLASSIFIER.match(stripped)
+            if heading:
+                # Determine level based on numbering
+                numbered = heading.group('numbered')
+                level = numbered.count('.') + 1 if numbered else 1
+            elif stripped.isupper() and 3 < len(stripped) < 50 and ' ' in stripped:
+                # Short uppercase lines (potential headings)
+                level = 1
+
+        is_code = (
+            line.startswith(('    ', '\t'))
+            or CODE_CLASSIFIER.search(stripped.lower()) is not None
+            or NUMBERED_STEP.match(stripped) is not None
+        )
+        return level, is_code
 
     def _is_heading(self, line: str) -> Tuple[bool, int]:
         """
@@ -319,101 +670,20 @@ class PDFExtractor:
         Returns:
             Tuple of (is_heading, level)
         """
-        if not line or len(line) < 3:
-            return False, 0
-
-        # Check against heading patterns
-        for pattern in self.heading_patterns:
-            if pattern.match(line):
-                # Determine level based on numbering
-                if line[0].isdigit():
-                    level = line.split()[0].count('.') + 1
-                else:
-                    level = 1
-                return True, level
-
-        # Check for short uppercase lines (potential headings)
-        if line.isupper() and 3 < len(line) < 50 and ' ' in line:
-            return True, 1
-
-        return False, 0
+        level, _ = self._classify_line(line, line)
+        return level > 0, level
 
     def _extract_code_blocks(self, text: str) -> List[CodeBlock]:
         """Extract code blocks from text"""
-        code_blocks = []
-        lines = text.split('\n')
-
-        in_code_block = False
-        current_code = []
-        code_start_line = 0
-        context = ''
-
-        for i, line in enumerate(lines):
-            # Check if line looks like code
-            is_code = self._is_code_line(line)
-
-            if is_code and not in_code_block:
-                # Start of code block
-                in_code_block = True
-                code_start_line = i
-                current_code = [line]
-                # Capture context (previous line)
-                if i > 0:
-                    context = lines[i - 1].strip()
-            elif is_code and in_code_block:
-                # Continue code block
-                current_code.append(line)
-            elif not is_code and in_code_block:
-                # End of code block
-                if len(current_code) > 2:  # Minimum 3 lines for a code block
-                    code_blocks.append(CodeBlock(
-                        language=self._detect_language('\n'.join(current_code)),
-                        code='\n'.join(current_code),
-                        line_number=code_start_line,
-                        context=context
-                    ))
-                in_code_block = False
-                current_code = []
-                context = ''
-
-        # Save last code block if exists
-        if in_code_block and len(current_code) > 2:
-            code_blocks.append(CodeBlock(
-                language=self._detect_language('\n'.join(current_code)),
-                code='\n'.join(current_code),
-                line_number=code_start_line,
-                context=context
-            ))
-
-        logger.info(f"Extracted {len(code_blocks)} code blocks")
-        return code_blocks
+        processor = _LineStreamProcessor(self)
+        processor.feed(text.split('\n'))
+        processor.finish()
+        return processor.code_blocks
 
     def _is_code_line(self, line: str) -> bool:
         """Check if a line looks like code"""
-        stripped = line.strip()
-
-        # Empty lines don't indicate code
-        if not stripped:
-            return False
-
-        # Check for code indicators
-        for indicator in self.code_indicators:
-            if indicator in stripped.lower():
-                return True
-
-        # Check for indentation (common in code)
-        if line.startswith('    ') or line.startswith('\t'):
-            return True
-
-        # Check for common code patterns
-        if re.search(r'[=\+\-\*\/]{2,}', stripped):  # Multiple operators
-            return True
-        if re.search(r'[\(\)\{\}\[\];]', stripped):  # Brackets and semicolons
-            return True
-        if re.search(r'^\s*\d+[\.\)]\s+', stripped):  # Numbered steps (algorithm)
-            return True
-
-        return False
+        _, is_code = self._classify_line(line)
+        return is_code
 
     def _detect_language(self, code: str) -> Optional[str]:
         """Detect programming language from code"""
@@ -476,3 +746,130 @@ class PDFExtractor:
                 logger.warning(f"PyPDF2 metadata extraction failed: {e}")
 
         return {}
+
+
+class _LineStreamProcessor:
+    """
+    Incremental title, section and code-block detection over a line stream.
+
+    Each line is labelled once by PDFExtractor._classify_line, then two
+    state machines (open section, open code block) consume the labels, so a
+    document is processed in a single forward pass and items become
+    available as soon as the line that closes them has been seen.
+    """
+
+    # Title candidates are taken from the first lines of the document
+    TITLE_SEARCH_LINES = 20
+
+    # Minimum lines for a run of code-like lines to count as a code block
+    MIN_CODE_BLOCK_LINES = 3
+
+    def __init__(self, extractor: 'PDFExtractor', collect: bool = True):
+        """
+        Args:
+            extractor: Extractor providing line classification
+            collect: Also keep completed items in self.sections and
+                self.code_blocks (off when they are only streamed out)
+        """
+        self.extractor = extractor
+        self.collect = collect
+        self.line_number = 0
+        self.title_candidate: Optional[str] = None
+        self.sections: List[Section] = []
+        self.code_blocks: List[CodeBlock] = []
+
+        self._section: Optional[Section] = None
+        self._section_lines: List[str] = []
+        self._code_lines: List[str] = []
+        self._code_start = 0
+        self._code_context = ''
+        self._previous_line: Optional[str] = None
+
+    def feed(self, lines: Iterable[str]) -> List[Union[Section, CodeBlock]]:
+        """
+        Consume lines and return the items they completed.
+
+        Args:
+            lines: Lines without trailing newlines
+
+        Returns:
+            Sections and code blocks closed by these lines
+        """
+        completed = []
+
+        for line in lines:
+            stripped = line.strip()
+
+            # Title: first line of plausible length that is not a page marker
+            if (self.title_candidate is None and self.line_number < self.TITLE_SEARCH_LINES
+                    and 10 < len(stripped) < 200 and not stripped.startswith('---')):
+                self.title_candidate = stripped
+
+            level, is_code = self.extractor._classify_line(line, stripped)
+
+            # Sections: a heading closes the open section and starts a new one
+            if level:
+                if self._section:
+                    completed.append(self._close_section())
+                self._section = Section(
+                    heading=stripped,
+                    level=level,
+                    content='',
+                    line_number=self.line_number,
+                    subsections=[]
+                )
+                self._section_lines = []
+            elif self._section:
+                self._section_lines.append(line)
+
+            # Code blocks: runs of code-like lines, context is the line before
+            if is_code:
+                if not self._code_lines:
+                    self._code_start = self.line_number
+                    self._code_context = self._previous_line.strip() if self._previous_line is not None else ''
+                self._code_lines.append(line)
+            elif self._code_lines:
+                code_block = self._close_code_block()
+                if code_block:
+                    completed.append(code_block)
+
+            self._previous_line = line
+            self.line_number += 1
+
+        return completed
+
+    def finish(self) -> List[Union[Section, CodeBlock]]:
+        """Close any open section and code block at end of input"""
+        completed = []
+        if self._section:
+            completed.append(self._close_section())
+        if self._code_lines:
+            code_block = self._close_code_block()
+            if code_block:
+                completed.append(code_block)
+        return completed
+
+    def _close_section(self) -> Section:
+        section = self._section
+        section.content = '\n'.join(self._section_lines).strip()
+        if self.collect:
+            self.sections.append(section)
+        self._section = None
+        self._section_lines = []
+        return section
+
+    def _close_code_block(self) -> Optional[CodeBlock]:
+        code_block = None
+        if len(self._code_lines) >= self.MIN_CODE_BLOCK_LINES:
+            code = '\n'.join(self._code_lines)
+            code_block = CodeBlock(
+                language=self.extractor._detect_language(code),
+                code=code,
+                line_number=self._code_start,
+                context=self._code_context
+            )
+            if self.collect:
+                self.code_blocks.append(code_block)
+        self._code_lines = []
+        self._code_context = ''
+        return code_block
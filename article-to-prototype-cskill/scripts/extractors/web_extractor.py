@@ -5,12 +5,16 @@ Fetches and extracts content from web pages and online documentation.
 Removes boilerplate, extracts code blocks, and preserves article structure.
 """
 
+import codecs
 import logging
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, urldefrag
 from dataclasses import dataclass
 
 try:
@@ -20,11 +24,17 @@ except ImportError:
     HAS_REQUESTS = False
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString, CData
     HAS_BS4 = True
 except ImportError:
     HAS_BS4 = False
 
+try:
+    import lxml  # noqa: F401 (BeautifulSoup tree builder)
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 try:
     import trafilatura
     HAS_TRAFILATURA = True
@@ -32,15 +42,61 @@ except ImportError:
     HAS_TRAFILATURA = False
 
 from .pdf_extractor import ExtractedContent, Section, CodeBlock
+from .http_cache import HTTPCache
 
 logger = logging.getLogger(__name__)
 
+# Crawl defaults: concurrent fetches and minimum seconds between requests
+# to the same host
+DEFAULT_CRAWL_WORKERS = 4
+DEFAULT_CRAWL_DELAY = 1.0
+
+# Batch extraction defaults: total concurrent fetches and fetches per host
+DEFAULT_BATCH_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 2
+
+# Pooled connections kept per host by the shared session
+CONNECTION_POOL_SIZE = 16
+
+# Download limits: pages larger than this are rejected, bodies are read in chunks
+MAX_PAGE_BYTES = 10 * 1024 * 1024
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Content types worth downloading; anything else is aborted before the body
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+# BeautifulSoup tree builder: lxml is several times faster than html.parser
+HTML_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+# Elements removed as boilerplate before extracting page content
+BOILERPLATE_TAGS = frozenset({'script', 'style', 'nav', 'header', 'footer', 'aside'})
+HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+SECTION_TAGS = HEADING_TAGS | {'p', 'pre'}
+CODE_TAGS = frozenset({'pre', 'code'})
+# Sibling elements whose text serves as a code block's context
+CONTEXT_TAGS = frozenset({'p', 'h1', 'h2', 'h3', 'h4'})
+CONTENT_CLASS_PATTERN = re.compile(r'content|article|post', re.I)
+
 
 class WebExtractionError(Exception):
     """Raised when web extraction fails"""
     pass
 
 
+@dataclass
+class BatchResult:
+    """Outcome of one URL in extract_many()"""
+    url: str
+    content: Optional[ExtractedContent] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.content is not None
+
+
 class WebExtractor:
     """Extracts content from web pages with boilerplate removal"""
 
@@ -48,7 +104,11 @@ class WebExtractor:
         self,
         timeout: int = 30,
         max_retries: int = 3,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        http_cache: Optional[HTTPCache] = None,
+        offline: bool = False,
+        single_pass: bool = False,
+        max_bytes: int = MAX_PAGE_BYTES
     ):
         """
         Initialize web extractor.
@@ -57,7 +117,15 @@ class WebExtractor:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             user_agent: Custom user agent string
+            http_cache: Cache for conditional requests and offline replay
+            offline: Serve pages only from http_cache, never from the network
+            single_pass: Skip trafilatura and extract everything from one
+                parse tree in a single traversal (fastest, lowest memory)
+            max_bytes: Largest page body to download
         """
+        if offline and http_cache is None:
+            raise ValueError("offline mode requires an http_cache")
+
         if not HAS_REQUESTS:
             raise ImportError("requests library not installed. Install with: pip install requests")
 
@@ -69,6 +137,10 @@ class WebExtractor:
 
         self.timeout = timeout
         self.max_retries = max_retries
+        self.http_cache = http_cache
+        self.offline = offline
+        self.single_pass = single_pass
+        self.max_bytes = max_bytes
         self.user_agent = user_agent or (
             "Mozilla/5.0 (compatible; Article-to-Prototype/1.0)"
         )
@@ -76,6 +148,14 @@ class WebExtractor:
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': self.user_agent})
 
+        # Size the pool for concurrent crawls so workers reuse connections
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def extract(self, url: str) -> ExtractedContent:
         """
         Extract content from a web page.
@@ -98,8 +178,17 @@ class WebExtractor:
         # Fetch HTML content
         html = self._fetch_html(url)
 
-        # Extract content using best available method
-        if HAS_TRAFILATURA:
+        return self._extract_from_html(html, url)
+
+    def _extract_from_html(self, html: str, url: str) -> ExtractedContent:
+        """Extract content from already-fetched HTML using the best available method"""
+        content = self._extract_with_best_method(html, url)
+        # Page size for instrumentation counters
+        content.metadata['html_chars'] = len(html)
+        return content
+
+    def _extract_with_best_method(self, html: str, url: str) -> ExtractedContent:
+        if HAS_TRAFILATURA and not (self.single_pass and HAS_BS4):
             try:
                 return self._extract_with_trafilatura(html, url)
             except Exception as e:
@@ -125,6 +214,14 @@ class WebExtractor:
         """
         Fetch HTML content with retries.
 
+        The body is streamed and decoded incrementally. Non-HTML content
+        types are rejected from the headers alone, and downloads stop as
+        soon as they exceed max_bytes.
+
+        With an HTTP cache, revisits send If-None-Match/If-Modified-Since
+        and reuse the cached body on 304 Not Modified. In offline mode the
+        cached body is returned without touching the network.
+
         Args:
             url: URL to fetch
 
@@ -134,21 +231,36 @@ class WebExtractor:
         Raises:
             WebExtractionError: If fetching fails
         """
+        cached = self.http_cache.get(url) if self.http_cache else None
+
+        if self.offline:
+            if cached is None:
+                raise WebExtractionError(f"Not in HTTP cache (offline mode): {url}")
+            logger.info(f"Replaying cached page: {url}")
+            return cached.body
+
+        headers = cached.conditional_headers() if cached else {}
         last_error = None
 
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.debug(f"Fetching URL (attempt {attempt}/{self.max_retries})")
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
+                with self.session.get(
+                    url, timeout=self.timeout, headers=headers, stream=True
+                ) as response:
+                    if response.status_code == 304 and cached is not None:
+                        self.http_cache.revalidated += 1
+                        logger.info(f"Not modified, using cached copy: {url}")
+                        return cached.body
+
+                    response.raise_for_status()
+                    html = self._read_body(response, url)
 
-                # Check content type
-                content_type = response.headers.get('Content-Type', '').lower()
-                if 'text/html' not in content_type and 'text/plain' not in content_type:
-                    logger.warning(f"Unexpected content type: {content_type}")
+                logger.info(f"Successfully fetched {len(html)} characters")
 
-                logger.info(f"Successfully fetched {len(response.text)} characters")
-                return response.text
+                if self.http_cache:
+                    self.http_cache.put(url, html, response.headers)
+                return html
 
             except requests.exceptions.Timeout as e:
                 last_error = e
@@ -178,6 +290,58 @@ class WebExtractor:
 
         raise WebExtractionError(f"Failed to fetch URL after {self.max_retries} attempts: {last_error}")
 
+    def _read_body(self, response: Any, url: str) -> str:
+        """
+        Stream and decode a response body within the size limit.
+
+        Raises:
+            WebExtractionError: On a non-HTML content type or oversized body
+        """
+        content_type = response.headers.get('Content-Type', '').lower()
+        if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+            raise WebExtractionError(f"Unsupported content type '{content_type}': {url}")
+
+        declared_length = response.headers.get('Content-Length', '')
+        if declared_length.isdigit() and int(declared_length) > self.max_bytes:
+            raise WebExtractionError(
+                f"Page too large ({int(declared_length)} bytes, limit {self.max_bytes}): {url}"
+            )
+
+        decoder = None
+        parts = []
+        received = 0
+
+        for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise WebExtractionError(f"Page exceeds {self.max_bytes} bytes: {url}")
+
+            if decoder is None:
+                encoding = self._detect_encoding(content_type, response.encoding, chunk)
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            parts.append(decoder.decode(chunk))
+
+        if decoder is not None:
+            parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+
+    @staticmethod
+    def _detect_encoding(content_type: str, header_encoding: Optional[str], head: bytes) -> str:
+        """Pick the body encoding: header charset, then <meta charset>, then UTF-8"""
+        candidates = []
+        if 'charset=' in content_type and header_encoding:
+            candidates.append(header_encoding)
+        match = META_CHARSET_PATTERN.search(head)
+        if match:
+            candidates.append(match.group(1).decode('ascii', 'replace'))
+
+        for encoding in candidates:
+            try:
+                return codecs.lookup(encoding).name
+            except LookupError:
+                logger.debug(f"Unknown encoding '{encoding}', ignoring")
+        return 'utf-8'
+
     def _extract_with_trafilatura(self, html: str, url: str) -> ExtractedContent:
         """Extract using trafilatura (preferred for main content)"""
         logger.debug("Using trafilatura for extraction")
@@ -210,8 +374,9 @@ class WebExtractor:
         # Also use BeautifulSoup for code blocks if available
         code_blocks = []
         if HAS_BS4:
-            soup = BeautifulSoup(html, 'html.parser')
-            code_blocks = self._extract_code_blocks_bs4(soup)
+            scan = _HTMLScan(skip_tags=()).run(BeautifulSoup(html, HTML_PARSER))
+            code_blocks = scan.code_blocks(scan.root_bit)
+            logger.info(f"Extracted {len(code_blocks)} code blocks")
 
         # Extract sections from main text
         sections = self._parse_text_into_sections(main_text)
@@ -230,157 +395,40 @@ class WebExtractor:
         )
 
     def _extract_with_beautifulsoup(self, html: str, url: str) -> ExtractedContent:
-        """Extract using BeautifulSoup (fallback method)"""
-        logger.debug("Using BeautifulSoup for extraction")
-
-        soup = BeautifulSoup(html, 'html.parser')
+        """
+        Extract using BeautifulSoup (fallback and single-pass method).
 
-        # Remove script and style elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            element.decompose()
+        The page is parsed once and a single traversal collects title,
+        metadata, main-content text, sections and code blocks.
+        """
+        logger.debug(f"Using BeautifulSoup ({HTML_PARSER}) for extraction")
 
-        # Extract title
-        title_tag = soup.find('title')
-        title = title_tag.get_text().strip() if title_tag else 'Untitled Article'
+        scan = _HTMLScan().run(BeautifulSoup(html, HTML_PARSER))
 
         # Try to find main content area
-        main_content = (
-            soup.find('main') or
-            soup.find('article') or
-            soup.find('div', class_=re.compile(r'content|article|post', re.I)) or
-            soup.find('body')
-        )
-
-        if not main_content:
+        content_bit = scan.main_content_bit()
+        if content_bit is None:
             raise WebExtractionError("Could not find main content area")
 
-        # Extract text
-        text = main_content.get_text(separator='\n', strip=True)
-
-        # Extract metadata from meta tags
-        metadata = self._extract_metadata_bs4(soup)
+        metadata = scan.metadata()
         metadata['url'] = url
 
-        # Extract sections
-        sections = self._extract_sections_bs4(main_content)
+        sections = scan.sections(content_bit)
+        logger.info(f"Extracted {len(sections)} sections")
 
-        # Extract code blocks
-        code_blocks = self._extract_code_blocks_bs4(main_content)
+        code_blocks = scan.code_blocks(content_bit)
+        logger.info(f"Extracted {len(code_blocks)} code blocks")
 
         return ExtractedContent(
-            title=title,
+            title=scan.title if scan.title is not None else 'Untitled Article',
             sections=sections,
             code_blocks=code_blocks,
             metadata=metadata,
             source_url=url,
             extraction_date=datetime.now(),
-            raw_text=text
+            raw_text=scan.text(content_bit)
         )
 
-    def _extract_metadata_bs4(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract metadata from HTML meta tags"""
-        metadata = {}
-
-        # Try Open Graph tags
-        og_title = soup.find('meta', property='og:title')
-        if og_title:
-            metadata['title'] = og_title.get('content', '')
-
-        og_description = soup.find('meta', property='og:description')
-        if og_description:
-            metadata['description'] = og_description.get('content', '')
-
-        og_author = soup.find('meta', property='og:author')
-        if og_author:
-            metadata['author'] = og_author.get('content', '')
-
-        # Try standard meta tags
-        if 'description' not in metadata:
-            description = soup.find('meta', attrs={'name': 'description'})
-            if description:
-                metadata['description'] = description.get('content', '')
-
-        if 'author' not in metadata:
-            author = soup.find('meta', attrs={'name': 'author'})
-            if author:
-                metadata['author'] = author.get('content', '')
-
-        return metadata
-
-    def _extract_sections_bs4(self, content: BeautifulSoup) -> List[Section]:
-        """Extract sections based on heading tags"""
-        sections = []
-        current_section = None
-        current_content = []
-
-        for element in content.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'pre']):
-            if element.name.startswith('h'):
-                # Save previous section
-                if current_section:
-                    current_section.content = '\n'.join(current_content).strip()
-                    sections.append(current_section)
-
-                # Start new section
-                level = int(element.name[1])
-                current_section = Section(
-                    heading=element.get_text().strip(),
-                    level=level,
-                    content='',
-                    line_number=0,
-                    subsections=[]
-                )
-                current_content = []
-            elif current_section:
-                text = element.get_text().strip()
-                if text:
-                    current_content.append(text)
-
-        # Save last section
-        if current_section:
-            current_section.content = '\n'.join(current_content).strip()
-            sections.append(current_section)
-
-        logger.info(f"Extracted {len(sections)} sections")
-        return sections
-
-    def _extract_code_blocks_bs4(self, content: BeautifulSoup) -> List[CodeBlock]:
-        """Extract code blocks from HTML"""
-        code_blocks = []
-
-        # Find all code blocks (pre, code tags)
-        for i, code_element in enumerate(content.find_all(['pre', 'code'])):
-            code_text = code_element.get_text().strip()
-
-            if not code_text or len(code_text) < 10:
-                continue
-
-            # Try to detect language from class
-            language = None
-            classes = code_element.get('class', [])
-            for cls in classes:
-                if cls.startswith('language-'):
-                    language = cls.replace('language-', '')
-                    break
-                elif cls.startswith('lang-'):
-                    language = cls.replace('lang-', '')
-                    break
-
-            # Get context (surrounding text)
-            context = ''
-            prev_sibling = code_element.find_previous_sibling(['p', 'h1', 'h2', 'h3', 'h4'])
-            if prev_sibling:
-                context = prev_sibling.get_text().strip()[:100]
-
-            code_blocks.append(CodeBlock(
-                language=language,
-                code=code_text,
-                line_number=i,
-                context=context
-            ))
-
-        logger.info(f"Extracted {len(code_blocks)} code blocks")
-        return code_blocks
-
     def _parse_text_into_sections(self, text: str) -> List[Section]:
         """Parse plain text into sections based on structure"""
         sections = []
@@ -437,66 +485,456 @@ class WebExtractor:
         content = self.extract(url)
         return content.code_blocks
 
+    def extract_many(
+        self,
+        urls: Iterable[str],
+        workers: int = DEFAULT_BATCH_WORKERS,
+        per_host: int = DEFAULT_PER_HOST_LIMIT
+    ) -> Iterator[BatchResult]:
+        """
+        Extract many URLs concurrently, yielding results as they complete.
+
+        Fetches share the session's connection pool and keep extract()'s
+        retry and backoff behavior. At most 'per_host' requests run against
+        any one host; URLs waiting on a busy host do not hold up other
+        hosts. Duplicate URLs are extracted once.
+
+        Args:
+            urls: URLs to extract
+            workers: Maximum number of concurrent extractions
+            per_host: Maximum concurrent extractions per host
+
+        Returns:
+            Iterator of BatchResult per unique URL, in completion order
+
+        Raises:
+            ValueError: If workers or per_host is less than 1
+        """
+        # Checked before the generator starts so bad limits fail at the call
+        if workers < 1:
+            raise ValueError("extract_many needs at least one worker")
+        if per_host < 1:
+            raise ValueError("extract_many needs per_host of at least 1")
+        return self._extract_many(urls, workers, per_host)
+
+    def _extract_many(self, urls: Iterable[str], workers: int, per_host: int) -> Iterator[BatchResult]:
+        pending: Dict[str, deque] = {}
+        seen = set()
+        for url in urls:
+            if url in seen:
+                continue
+            seen.add(url)
+            pending.setdefault(urlparse(url).netloc, deque()).append(url)
+
+        logger.info(f"Extracting {len(seen)} URLs from {len(pending)} hosts")
+
+        active: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = {}
+
+            while pending or in_flight:
+                # Round-robin over hosts with free slots until workers are busy
+                for host in list(pending):
+                    if len(in_flight) >= workers:
+                        break
+                    queue = pending[host]
+                    while queue and active.get(host, 0) < per_host and len(in_flight) < workers:
+                        url = queue.popleft()
+                        in_flight[executor.submit(self.extract, url)] = (host, url)
+                        active[host] = active.get(host, 0) + 1
+                    if not queue:
+                        del pending[host]
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host, url = in_flight.pop(future)
+                    active[host] -= 1
+                    try:
+                        yield BatchResult(url=url, content=future.result())
+                    except Exception as e:
+                        logger.error(f"Failed to extract {url}: {e}")
+                        yield BatchResult(url=url, error=str(e))
+
     def crawl_documentation(
         self,
         base_url: str,
         max_pages: int = 10,
-        follow_pattern: Optional[str] = None
+        follow_pattern: Optional[str] = None,
+        workers: int = DEFAULT_CRAWL_WORKERS,
+        delay: float = DEFAULT_CRAWL_DELAY
     ) -> List[ExtractedContent]:
         """
         Crawl multi-page documentation.
 
+        Pages are fetched by a pool of worker threads sharing the session's
+        connection pool. Requests to the same host are spaced at least
+        'delay' seconds apart; different hosts are fetched independently.
+        Links are taken from the HTML fetched for extraction, so each page
+        is downloaded once. URL fragments are ignored when deduplicating.
+
         Args:
             base_url: Starting URL
             max_pages: Maximum number of pages to crawl
             follow_pattern: Regex pattern for URLs to follow (optional)
+            workers: Maximum number of concurrent fetches
+            delay: Minimum seconds between requests to the same host
 
         Returns:
-            List of ExtractedContent objects
+            List of ExtractedContent objects, in breadth-first discovery order
 
         Note: This is a basic implementation. For production use,
         consider using a proper crawler like Scrapy.
         """
         logger.info(f"Starting documentation crawl from: {base_url}")
-        logger.warning("Crawling is experimental and may be slow")
-
-        visited = set()
-        to_visit = [base_url]
-        results = []
 
         pattern = re.compile(follow_pattern) if follow_pattern else None
+        rate_limiter = HostRateLimiter(delay)
+
+        start_url = urldefrag(base_url)[0]
+        seen = {start_url}
+        frontier = deque([(0, start_url)])
+        discovered = 1
+        results: List[Tuple[int, ExtractedContent]] = []
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            in_flight = {}
+
+            while frontier or in_flight:
+                # Keep workers busy without scheduling more pages than needed
+                while frontier and len(results) + len(in_flight) < max_pages:
+                    order, url = frontier.popleft()
+                    future = executor.submit(self._crawl_page, url, pattern, rate_limiter)
+                    in_flight[future] = (order, url)
+
+                if not in_flight:
+                    break
 
-        while to_visit and len(results) < max_pages:
-            url = to_visit.pop(0)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    order, url = in_flight.pop(future)
+                    try:
+                        content, links = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to crawl {url}: {e}")
+                        continue
+
+                    results.append((order, content))
+                    logger.info(f"Crawled {len(results)}/{max_pages}: {url}")
+
+                    for link in links:
+                        if link not in seen:
+                            seen.add(link)
+                            frontier.append((discovered, link))
+                            discovered += 1
+
+                if len(results) >= max_pages:
+                    # Drop queued work; pages already in flight finish but are not kept
+                    frontier.clear()
+                    for future in in_flight:
+                        future.cancel()
+                    break
+
+        results.sort(key=lambda item: item[0])
+        pages = [content for _, content in results[:max_pages]]
+
+        logger.info(f"Crawling complete. Extracted {len(pages)} pages")
+        return pages
+
+    def _crawl_page(
+        self,
+        url: str,
+        pattern: Optional['re.Pattern'],
+        rate_limiter: 'HostRateLimiter'
+    ) -> Tuple[ExtractedContent, List[str]]:
+        """
+        Fetch one page, extract it and collect the links to follow.
 
-            if url in visited:
+        Returns:
+            Tuple of (content, absolute URLs matching pattern)
+        """
+        if not self._is_valid_url(url):
+            raise WebExtractionError(f"Invalid URL: {url}")
+
+        rate_limiter.wait(url)
+        html = self._fetch_html(url)
+        content = self._extract_from_html(html, url)
+
+        links = self._extract_links(html, url, pattern) if pattern else []
+        return content, links
+
+    def _extract_links(
+        self,
+        html: str,
+        url: str,
+        pattern: 're.Pattern'
+    ) -> List[str]:
+        """Collect absolute, fragment-free link targets matching pattern"""
+        if not HAS_BS4:
+            return []
+
+        links = []
+        anchors = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('a', href=True))
+        for link in anchors.find_all('a', href=True):
+            absolute_url = urldefrag(urljoin(url, link['href']))[0]
+            if pattern.match(absolute_url):
+                links.append(absolute_url)
+        return links
+
+
+class HostRateLimiter:
+    """Thread-safe minimum interval between requests to the same host"""
+
+    def __init__(self, delay: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            delay: Minimum seconds between request starts per host
+        """
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """Block until a request to url's host is allowed"""
+        if self.delay <= 0:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _HTMLScan:
+    """
+    Single traversal over a BeautifulSoup tree.
+
+    Collects everything the extractor needs in one walk instead of a
+    find()/find_all() pass per field. Main-content candidates (first
+    <main>, first <article>, first content-like <div>, first <body>) are
+    tracked as bits, and every collected string and element records which
+    candidates enclose it, so any candidate can serve as the content area
+    after the walk. Element text is accumulated while walking, so no
+    subtree is visited twice.
+    """
+
+    MAIN_BIT = 1
+    ARTICLE_BIT = 2
+    CONTENT_DIV_BIT = 4
+    BODY_BIT = 8
+    # Set on everything; selects the whole document
+    root_bit = 16
+
+    TEXT_TYPES = (NavigableString, CData) if HAS_BS4 else ()
+
+    def __init__(self, skip_tags: frozenset = BOILERPLATE_TAGS):
+        """
+        Initialize scan.
+
+        Args:
+            skip_tags: Elements whose subtrees are ignored entirely
+        """
+        self.skip_tags = skip_tags
+        self.title: Optional[str] = None
+        self.found_bits = 0
+        self._title_parts: Optional[List[str]] = None
+        self._meta_property: Dict[str, str] = {}
+        self._meta_name: Dict[str, str] = {}
+        # (mask, stripped string) for every non-blank text node
+        self._strings: List[Tuple[int, str]] = []
+        # (mask, tag name, text parts) for section elements
+        self._section_elements: List[Tuple[int, str, List[str]]] = []
+        # (mask, classes, text parts, context text parts) for pre/code elements
+        self._code_elements: List[Tuple[int, List[str], List[str], Optional[List[str]]]] = []
+
+    def run(self, root: 'BeautifulSoup') -> '_HTMLScan':
+        """Walk the tree once; returns self"""
+        open_parts: List[List[str]] = []
+        # Frames: [children iterator, mask, opened text parts, last context sibling parts]
+        stack = [[iter(root.contents), self.root_bit, None, None]]
+
+        while stack:
+            frame = stack[-1]
+            node = next(frame[0], None)
+
+            if node is None:
+                stack.pop()
+                if frame[2] is not None:
+                    open_parts.pop()
                 continue
 
-            visited.add(url)
+            node_type = type(node)
+            if node_type in self.TEXT_TYPES:
+                for parts in open_parts:
+                    parts.append(node)
+                stripped = node.strip()
+                if stripped:
+                    self._strings.append((frame[1], stripped))
+                continue
 
-            try:
-                content = self.extract(url)
-                results.append(content)
-                logger.info(f"Crawled {len(results)}/{max_pages}: {url}")
+            if not isinstance(node, Tag):
+                continue
 
-                # Find links to follow (basic implementation)
-                if pattern and HAS_BS4:
-                    html = self._fetch_html(url)
-                    soup = BeautifulSoup(html, 'html.parser')
+            name = node.name
+            if name in self.skip_tags:
+                continue
 
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        absolute_url = urljoin(url, href)
+            mask = frame[1]
+            child_mask = mask | self._candidate_bit(node, name)
+
+            parts = None
+            if name in SECTION_TAGS or name in CODE_TAGS or (name == 'title' and self._title_parts is None):
+                parts = []
+                open_parts.append(parts)
+
+                if name in SECTION_TAGS:
+                    self._section_elements.append((mask, name, parts))
+                if name in CODE_TAGS:
+                    self._code_elements.append((mask, node.get('class', []), parts, frame[3]))
+                if name == 'title' and self._title_parts is None:
+                    self._title_parts = parts
+
+            if name in CONTEXT_TAGS:
+                frame[3] = parts
+            elif name == 'meta':
+                self._record_meta(node)
+
+            stack.append([iter(node.contents), child_mask, parts, None])
+
+        if self._title_parts is not None:
+            self.title = ''.join(self._title_parts).strip()
+        return self
+
+    def _candidate_bit(self, node: 'Tag', name: str) -> int:
+        """Return the candidate bit if node is the first element of its kind"""
+        if name == 'main':
+            bit = self.MAIN_BIT
+        elif name == 'article':
+            bit = self.ARTICLE_BIT
+        elif name == 'body':
+            bit = self.BODY_BIT
+        elif name == 'div' and not self.found_bits & self.CONTENT_DIV_BIT:
+            classes = node.get('class') or []
+            if isinstance(classes, str):
+                classes = [classes]
+            if not any(CONTENT_CLASS_PATTERN.search(cls) for cls in classes):
+                return 0
+            bit = self.CONTENT_DIV_BIT
+        else:
+            return 0
+
+        if self.found_bits & bit:
+            return 0
+        self.found_bits |= bit
+        return bit
+
+    def _record_meta(self, node: 'Tag') -> None:
+        prop = node.get('property')
+        if isinstance(prop, str) and prop not in self._meta_property:
+            self._meta_property[prop] = node.get('content', '')
+        name = node.get('name')
+        if isinstance(name, str) and name not in self._meta_name:
+            self._meta_name[name] = node.get('content', '')
+
+    def main_content_bit(self) -> Optional[int]:
+        """Bit of the preferred content area: main, article, content div, then body"""
+        for bit in (self.MAIN_BIT, self.ARTICLE_BIT, self.CONTENT_DIV_BIT, self.BODY_BIT):
+            if self.found_bits & bit:
+                return bit
+        return None
+
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata from Open Graph tags, falling back to standard meta tags"""
+        metadata = {}
+        for key in ('title', 'description', 'author'):
+            if f'og:{key}' in self._meta_property:
+                metadata[key] = self._meta_property[f'og:{key}']
+        for key in ('description', 'author'):
+            if key not in metadata and key in self._meta_name:
+                metadata[key] = self._meta_name[key]
+        return metadata
 
-                        if absolute_url not in visited and pattern.match(absolute_url):
-                            to_visit.append(absolute_url)
+    def text(self, bit: int) -> str:
+        """Newline-joined stripped text inside the selected area"""
+        return '\n'.join(string for mask, string in self._strings if mask & bit)
 
-                # Rate limiting
-                time.sleep(1)
+    def sections(self, bit: int) -> List[Section]:
+        """Sections started by heading tags inside the selected area"""
+        sections = []
+        current_section = None
+        current_content = []
 
-            except Exception as e:
-                logger.error(f"Failed to crawl {url}: {e}")
+        for mask, name, parts in self._section_elements:
+            if not mask & bit:
+                continue
+
+            if name in HEADING_TAGS:
+                # Save previous section
+                if current_section:
+                    current_section.content = '\n'.join(current_content).strip()
+                    sections.append(current_section)
+
+                # Start new section
+                current_section = Section(
+                    heading=''.join(parts).strip(),
+                    level=int(name[1]),
+                    content='',
+                    line_number=0,
+                    subsections=[]
+                )
+                current_content = []
+            elif current_section:
+                text = ''.join(parts).strip()
+                if text:
+                    current_content.append(text)
+
+        # Save last section
+        if current_section:
+            current_section.content = '\n'.join(current_content).strip()
+            sections.append(current_section)
+
+        return sections
+
+    def code_blocks(self, bit: int) -> List[CodeBlock]:
+        """Code blocks from pre/code tags inside the selected area"""
+        code_blocks = []
+        index = 0
+
+        for mask, classes, parts, context_parts in self._code_elements:
+            if not mask & bit:
                 continue
+            i = index
+            index += 1
+
+            code_text = ''.join(parts).strip()
+            if not code_text or len(code_text) < 10:
+                continue
+
+            # Try to detect language from class
+            language = None
+            for cls in classes:
+                if cls.startswith('language-'):
+                    language = cls.replace('language-', '')
+                    break
+                elif cls.startswith('lang-'):
+                    language = cls.replace('lang-', '')
+                    break
 
-        logger.info(f"Crawling complete. Extracted {len(results)} pages")
-        return results
+            # Context is the nearest preceding paragraph or heading sibling
+            context = ''
+            if context_parts is not None:
+                context = ''.join(context_parts).strip()[:100]
+
+            code_blocks.append(CodeBlock(
+                language=language,
+                code=code_text,
+                line_number=i,
+                context=context
+            ))
+
+        return code_blocks
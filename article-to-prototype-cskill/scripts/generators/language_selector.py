@@ -5,7 +5,7 @@ Selects the optimal programming language for prototype generation.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,99 @@
+"""
+Instrumentation
+
+Lightweight per-stage metrics for the article-to-prototype pipeline: wall
+time, CPU time and (when tracemalloc is tracing) peak Python memory per
+stage, plus free-form counters such as pages, cells, bytes and code
+blocks reported by the extractors.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Functions listed by format_profile()
+PROFILE_TOP_FUNCTIONS = 25
+
+
+@dataclass
+class StageMetrics:
+    """Resource usage of one pipeline stage"""
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: Optional[int] = None
+
+
+class Instrumentation:
+    """Collects stage metrics and counters for one processed source"""
+
+    def __init__(self, track_memory: bool = True):
+        """
+        Initialize instrumentation.
+
+        Args:
+            track_memory: Record per-stage peak memory while tracemalloc is
+                tracing. tracemalloc's peak is process-wide, so turn this off
+                when stages of different sources run concurrently.
+        """
+        self.track_memory = track_memory
+        self.stages: Dict[str, StageMetrics] = {}
+        self.counters: Dict[str, Any] = {}  # updated directly by callers
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure a stage.
+
+        CPU time is measured for the calling thread, so stages running
+        concurrently in other threads are not counted; work done in child
+        processes (e.g. parallel PDF page extraction) is not included.
+        Peak memory is recorded only while tracemalloc is tracing and
+        track_memory is set.
+        """
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.stages[name] = StageMetrics(
+                wall_seconds=round(time.perf_counter() - wall_start, 6),
+                cpu_seconds=round(time.thread_time() - cpu_start, 6),
+                peak_memory_bytes=tracemalloc.get_traced_memory()[1] if tracing else None
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable metrics"""
+        return {
+            'stages': {name: asdict(metrics) for name, metrics in self.stages.items()},
+            'counters': dict(self.counters),
+        }
+
+
+def format_metrics(metrics: Dict[str, Any]) -> str:
+    """Render to_dict() output as an aligned text table"""
+    lines = [f"{'stage':<10} {'wall s':>9} {'cpu s':>9} {'peak MB':>9}"]
+    for name, stage in metrics.get('stages', {}).items():
+        peak = stage.get('peak_memory_bytes')
+        peak_text = f"{peak / (1024 * 1024):9.2f}" if peak is not None else f"{'-':>9}"
+        lines.append(f"{name:<10} {stage['wall_seconds']:9.3f} {stage['cpu_seconds']:9.3f} {peak_text}")
+    for name, value in metrics.get('counters', {}).items():
+        lines.append(f"{name}: {value}")
+    return '\n'.join(lines)
+
+
+def format_profile(profiler: cProfile.Profile, limit: int = PROFILE_TOP_FUNCTIONS) -> str:
+    """Return the top functions of a profile by cumulative time"""
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
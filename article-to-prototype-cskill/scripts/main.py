@@ -4,11 +4,20 @@ Article-to-Prototype Main Orchestrator
 Coordinates the extraction, analysis, and generation pipeline.
 """
 
+import glob
+import hashlib
+import json
 import logging
+import os
+import re
 import sys
+import time
 import argparse
+import cProfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 
 # Setup path for imports
@@ -18,6 +27,10 @@ from extractors.pdf_extractor import PDFExtractor, PDFExtractionError
 from extractors.web_extractor import WebExtractor, WebExtractionError
 from extractors.notebook_extractor import NotebookExtractor, NotebookExtractionError
 from extractors.markdown_extractor import MarkdownExtractor, MarkdownExtractionError
+from extractors.extraction_cache import ExtractionCache
+from extractors.http_cache import HTTPCache
+from pipeline import StagedPipeline, Stage
+from instrumentation import Instrumentation, format_metrics, format_profile
 from analyzers.content_analyzer import ContentAnalyzer
 from analyzers.code_detector import CodeDetector
 from generators.language_selector import LanguageSelector
@@ -30,18 +43,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# File types accepted when expanding directories and globs in corpus mode
+SUPPORTED_EXTENSIONS = ('.pdf', '.ipynb', '.md', '.markdown', '.txt')
+
+# Per-item results of a corpus run, one JSON object per line
+CORPUS_RESULTS_FILENAME = 'corpus_results.jsonl'
+
+# Threads per stage in pipelined corpus runs: extraction is mostly I/O
+# (web fetches, file reads), analysis and selection are CPU-bound
+PIPELINE_STAGES = ('extract', 'analyze', 'select', 'generate')
+DEFAULT_STAGE_WORKERS = {'extract': 4, 'analyze': 1, 'select': 1, 'generate': 2}
+
 
 class ArticleToPrototype:
     """Main orchestrator for article-to-prototype conversion"""
 
-    def __init__(self):
-        """Initialize orchestrator"""
-        self.pdf_extractor = PDFExtractor()
-        self.web_extractor = WebExtractor()
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True,
+        offline: bool = False,
+        pdf_workers: Optional[int] = None,
+        code_workers: Optional[int] = None
+    ):
+        """
+        Initialize orchestrator.
+
+        Args:
+            cache_dir: Cache directory holding extractions/ and http/
+                (default: ~/.cache/article-to-prototype)
+            use_cache: Reuse cached extractions and web pages
+            offline: Serve web pages only from the HTTP cache
+            pdf_workers: Processes for PDF page extraction (default: serial)
+            code_workers: Processes for analyzing documents with many code
+                blocks (default: CPU count)
+        """
+        if offline and not use_cache:
+            raise ValueError("offline mode requires the cache")
+
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.offline = offline
+
+        # Either way, extraction entries and web pages sit side by side in
+        # extractions/ and http/ under the cache directory
+        self.extraction_cache = None
+        self.http_cache = None
+        if use_cache:
+            self.extraction_cache = ExtractionCache(os.path.join(cache_dir, 'extractions') if cache_dir else None)
+            self.http_cache = HTTPCache(os.path.join(cache_dir, 'http') if cache_dir else None)
+        self.pdf_extractor = PDFExtractor(workers=pdf_workers)
+        self.web_extractor = WebExtractor(http_cache=self.http_cache, offline=offline)
         self.notebook_extractor = NotebookExtractor()
         self.markdown_extractor = MarkdownExtractor()
         self.content_analyzer = ContentAnalyzer()
-        self.code_detector = CodeDetector()
+        self.code_detector = CodeDetector(workers=code_workers)
         self.language_selector = LanguageSelector()
         self.prototype_generator = PrototypeGenerator()
 
@@ -60,60 +116,40 @@ class ArticleToPrototype:
             language_hint: Optional language hint from user
 
         Returns:
-            Dictionary with generation results
+            Dictionary with generation results, including per-stage
+            'metrics' (wall/CPU time, peak memory when tracemalloc is
+            tracing, and extraction counters)
         """
         logger.info(f"Processing source: {source}")
+        instrumentation = Instrumentation()
 
         try:
             # Step 1: Detect format and extract content
             logger.info("Step 1: Extracting content...")
-            content = self._extract_content(source)
+            with instrumentation.stage('extract'):
+                content = self._extract_content(source)
+            instrumentation.counters.update(self._extraction_counters(source, content))
 
             # Step 2: Analyze content
             logger.info("Step 2: Analyzing content...")
-            analysis = self.content_analyzer.analyze(content)
-            code_fragments = self.code_detector.detect_code_fragments(content)
-            language_hints = self.code_detector.detect_language_hints(content)
-
-            # Add to analysis metadata
-            analysis.metadata['code_fragments'] = len(code_fragments)
-            analysis.metadata['language_hints'] = language_hints
+            with instrumentation.stage('analyze'):
+                analysis = self._analyze(content)
 
             # Step 3: Select language
             logger.info("Step 3: Selecting programming language...")
-            language = self.language_selector.select_language(
-                analysis,
-                hint=language_hint
-            )
+            with instrumentation.stage('select'):
+                language = self.language_selector.select_language(
+                    analysis,
+                    hint=language_hint
+                )
 
             # Step 4: Generate prototype
             logger.info(f"Step 4: Generating {language} prototype...")
-            source_info = {
-                'title': content.title,
-                'source_url': content.source_url or source,
-                'extraction_date': content.extraction_date.isoformat(),
-            }
+            with instrumentation.stage('generate'):
+                result = self._generate(source, content, analysis, language, output_dir)
 
-            result = self.prototype_generator.generate(
-                analysis,
-                language,
-                output_dir,
-                source_info
-            )
-
-            logger.info(f"✅ Successfully generated prototype in: {output_dir}")
-
-            return {
-                'success': True,
-                'output_dir': output_dir,
-                'language': language,
-                'files_created': result.files_created,
-                'entry_point': result.entry_point,
-                'domain': analysis.domain,
-                'complexity': analysis.complexity,
-                'num_algorithms': len(analysis.algorithms),
-                'confidence': analysis.confidence,
-            }
+            result['metrics'] = instrumentation.to_dict()
+            return result
 
         except Exception as e:
             logger.error(f"❌ Failed to process article: {e}", exc_info=True)
@@ -121,12 +157,279 @@ class ArticleToPrototype:
                 'success': False,
                 'error': str(e),
                 'error_type': type(e).__name__,
+                'metrics': instrumentation.to_dict(),
+            }
+
+    def _extraction_counters(self, source: str, content: Any) -> Dict[str, Any]:
+        """Per-extractor counters reported in the result metrics"""
+        metadata = content.metadata or {}
+        counters = {
+            'sections': len(content.sections),
+            'code_blocks': len(content.code_blocks),
+            'text_chars': len(content.raw_text or ''),
+        }
+        if is_url(source):
+            counters['extractor'] = 'web'
+            if 'html_chars' in metadata:
+                counters['html_chars'] = metadata['html_chars']
+        else:
+            counters['extractor'] = Path(source).suffix.lower().lstrip('.')
+            try:
+                counters['bytes'] = os.path.getsize(source)
+            except OSError:
+                pass
+        if 'pages_extracted' in metadata:
+            counters['pages'] = metadata['pages_extracted']
+        if 'num_cells' in metadata:
+            counters['cells'] = metadata['num_cells']
+        return counters
+
+    def _analyze(self, content: Any) -> Any:
+        """Run content analysis and code detection (pipeline step 2)"""
+        # One pass over the code blocks feeds both the analyzer and the detector
+        block_analyses = self.code_detector.analyze_code_blocks(content.code_blocks)
+        analysis = self.content_analyzer.analyze(content, block_analyses)
+        code_fragments = self.code_detector.detect_code_fragments(content, block_analyses)
+        language_hints = self.code_detector.detect_language_hints(content)
+
+        # Add to analysis metadata
+        analysis.metadata['code_fragments'] = len(code_fragments)
+        analysis.metadata['language_hints'] = language_hints
+        return analysis
+
+    def _generate(
+        self,
+        source: str,
+        content: Any,
+        analysis: Any,
+        language: str,
+        output_dir: str
+    ) -> Dict[str, Any]:
+        """Generate the prototype and build the result dict (pipeline step 4)"""
+        source_info = {
+            'title': content.title,
+            'source_url': content.source_url or source,
+            'extraction_date': content.extraction_date.isoformat(),
+        }
+
+        result = self.prototype_generator.generate(
+            analysis,
+            language,
+            output_dir,
+            source_info
+        )
+
+        logger.info(f"✅ Successfully generated prototype in: {output_dir}")
+
+        return {
+            'success': True,
+            'output_dir': output_dir,
+            'language': language,
+            'files_created': result.files_created,
+            'entry_point': result.entry_point,
+            'domain': analysis.domain,
+            'complexity': analysis.complexity,
+            'num_algorithms': len(analysis.algorithms),
+            'confidence': analysis.confidence,
+        }
+
+    def process_corpus(
+        self,
+        inputs: List[str],
+        output_dir: str,
+        language_hint: Optional[str] = None,
+        workers: Optional[int] = None,
+        results_path: Optional[str] = None,
+        resume: bool = True,
+        pipelined: bool = False,
+        stage_workers: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Process many sources, fanning the pipeline out across processes.
+
+        With pipelined=True the sources instead flow through in-process
+        stages (extract, analyze, select, generate) joined by bounded
+        queues, each stage with its own thread count, so slow I/O such as
+        web fetches overlaps with analysis and generation of other items.
+
+        Each source gets its own subdirectory of output_dir. A failing
+        source is recorded and does not stop the run. Every finished item
+        is appended to a JSONL results file as soon as it completes, so an
+        interrupted run can be resumed: sources that already succeeded
+        are skipped, failed ones are retried.
+
+        Args:
+            inputs: Files, directories, glob patterns or URLs
+            output_dir: Root directory for generated prototypes
+            language_hint: Optional language hint applied to every source
+            workers: Worker process count (default: CPU count; 1 runs in-process)
+            results_path: JSONL results file (default: output_dir/corpus_results.jsonl)
+            resume: Skip sources recorded as successful in results_path
+            pipelined: Use the staged in-process pipeline instead of a process pool
+            stage_workers: Threads per pipeline stage (default: DEFAULT_STAGE_WORKERS)
+
+        Returns:
+            Summary dict with counts and the results path
+        """
+        sources = discover_sources(inputs)
+        os.makedirs(output_dir, exist_ok=True)
+        results_path = results_path or os.path.join(output_dir, CORPUS_RESULTS_FILENAME)
+
+        completed = load_completed_sources(results_path) if resume else set()
+        pending = [source for source in sources if source not in completed]
+        logger.info(
+            f"Corpus: {len(sources)} sources, {len(sources) - len(pending)} already done, "
+            f"{len(pending)} to process"
+        )
+
+        summary = {
+            'total': len(sources),
+            'skipped': len(sources) - len(pending),
+            'succeeded': 0,
+            'failed': 0,
+            'results_path': results_path,
+        }
+        if not pending:
+            return summary
+
+        workers = workers or os.cpu_count() or 1
+        settings = (self.cache_dir, self.use_cache, self.offline)
+        jobs = [
+            (source, corpus_output_dir(output_dir, source), language_hint)
+            for source in pending
+        ]
+
+        with open(results_path, 'a', encoding='utf-8') as results_file:
+            def record(entry: Dict[str, Any]) -> None:
+                results_file.write(json.dumps(entry, default=str) + '\n')
+                results_file.flush()
+                summary['succeeded' if entry.get('success') else 'failed'] += 1
+                status = 'ok' if entry.get('success') else f"failed: {entry.get('error')}"
+                logger.info(f"[{summary['succeeded'] + summary['failed']}/{len(jobs)}] {entry['source']}: {status}")
+
+            if pipelined:
+                for entry in self._process_pipelined(jobs, stage_workers):
+                    record(entry)
+            elif workers == 1:
+                for job in jobs:
+                    record(_process_corpus_item(*job, orchestrator=self))
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=min(workers, len(jobs)),
+                    initializer=_init_corpus_worker,
+                    initargs=settings
+                ) as executor:
+                    futures = {executor.submit(_process_corpus_item, *job): job for job in jobs}
+                    for future in as_completed(futures):
+                        source, item_output_dir, _ = futures[future]
+                        try:
+                            entry = future.result()
+                        except Exception as e:
+                            # The worker itself died (e.g. a crash in a native parser)
+                            entry = {
+                                'source': source,
+                                'output_dir': item_output_dir,
+                                'success': False,
+                                'error': str(e) or type(e).__name__,
+                                'error_type': type(e).__name__,
+                            }
+                        record(entry)
+
+        logger.info(
+            f"Corpus complete: {summary['succeeded']} succeeded, {summary['failed']} failed, "
+            f"{summary['skipped']} skipped"
+        )
+        return summary
+
+    def _process_pipelined(
+        self,
+        jobs: List[tuple],
+        stage_workers: Optional[Dict[str, int]] = None
+    ):
+        """
+        Run corpus jobs through the staged pipeline.
+
+        Yields:
+            Result entries in the same format as _process_corpus_item()
+        """
+        workers = {**DEFAULT_STAGE_WORKERS, **(stage_workers or {})}
+
+        # Stages run in threads: extract PDFs and analyze code blocks
+        # serially rather than forking process pools from those threads
+        # (one pool per concurrent job would oversubscribe the CPUs)
+        runner = ArticleToPrototype(
+            cache_dir=self.cache_dir,
+            use_cache=self.use_cache,
+            offline=self.offline,
+            pdf_workers=1,
+            code_workers=1
+        )
+
+        def extract(job: Dict[str, Any]) -> Dict[str, Any]:
+            job['start'] = time.perf_counter()
+            # Stages of other sources run concurrently, so the process-wide
+            # tracemalloc peak cannot be attributed to this one
+            job['instrumentation'] = instrumentation = Instrumentation(track_memory=False)
+            with instrumentation.stage('extract'):
+                job['content'] = runner._extract_content(job['source'])
+            instrumentation.counters.update(runner._extraction_counters(job['source'], job['content']))
+            return job
+
+        def analyze(job: Dict[str, Any]) -> Dict[str, Any]:
+            with job['instrumentation'].stage('analyze'):
+                job['analysis'] = runner._analyze(job['content'])
+            return job
+
+        def select(job: Dict[str, Any]) -> Dict[str, Any]:
+            with job['instrumentation'].stage('select'):
+                job['language'] = runner.language_selector.select_language(
+                    job['analysis'],
+                    hint=job['language_hint']
+                )
+            return job
+
+        def generate(job: Dict[str, Any]) -> Dict[str, Any]:
+            with job['instrumentation'].stage('generate'):
+                job['result'] = runner._generate(
+                    job['source'], job['content'], job['analysis'], job['language'], job['output_dir']
+                )
+            return job
+
+        pipeline = StagedPipeline([
+            Stage('extract', extract, workers['extract']),
+            Stage('analyze', analyze, workers['analyze']),
+            Stage('select', select, workers['select']),
+            Stage('generate', generate, workers['generate']),
+        ])
+        job_states = (
+            {'source': source, 'output_dir': output_dir, 'language_hint': language_hint}
+            for source, output_dir, language_hint in jobs
+        )
+
+        for item in pipeline.run(job_states):
+            job = item.value
+            if item.error is None:
+                result = job['result']
+                result['metrics'] = job['instrumentation'].to_dict()
+            else:
+                logger.error(f"❌ {item.failed_stage} failed for {job['source']}: {item.error}")
+                result = {
+                    'success': False,
+                    'error': str(item.error),
+                    'error_type': type(item.error).__name__,
+                    'stage': item.failed_stage,
+                }
+            yield {
+                'source': job['source'],
+                'output_dir': job['output_dir'],
+                'seconds': round(time.perf_counter() - job.get('start', time.perf_counter()), 3),
+                **result,
             }
 
     def _extract_content(self, source: str):
         """Extract content based on source type"""
         # Check if URL
-        if source.startswith('http://') or source.startswith('https://'):
+        if is_url(source):
             logger.info(f"Detected web URL: {source}")
             return self.web_extractor.extract(source)
 
@@ -140,23 +443,178 @@ class ArticleToPrototype:
 
         if ext == '.pdf':
             logger.info("Detected PDF file")
-            return self.pdf_extractor.extract(str(path))
+            extractor = self.pdf_extractor
 
         elif ext == '.ipynb':
             logger.info("Detected Jupyter notebook")
-            return self.notebook_extractor.extract(str(path))
+            extractor = self.notebook_extractor
 
         elif ext in ['.md', '.markdown']:
             logger.info("Detected Markdown file")
-            return self.markdown_extractor.extract(str(path))
+            extractor = self.markdown_extractor
 
         elif ext == '.txt':
             logger.info("Detected text file, treating as markdown")
-            return self.markdown_extractor.extract(str(path))
+            extractor = self.markdown_extractor
 
         else:
             raise ValueError(f"Unsupported file type: {ext}")
 
+        return self._extract_cached(extractor, str(path))
+
+    def _extract_cached(self, extractor: Any, path: str):
+        """Extract a file, reusing the cached result for unchanged content"""
+        if self.extraction_cache is None:
+            return extractor.extract(path)
+
+        key = self.extraction_cache.key(path, extractor)
+        content = self.extraction_cache.get(key, path)
+        if content is not None:
+            logger.info("Using cached extraction")
+            return content
+
+        content = extractor.extract(path)
+        self.extraction_cache.put(key, content)
+        return content
+
+
+def is_url(source: str) -> bool:
+    """Return True for http(s) URLs"""
+    return source.startswith('http://') or source.startswith('https://')
+
+
+def discover_sources(inputs: List[str]) -> List[str]:
+    """
+    Expand corpus inputs into a de-duplicated list of sources.
+
+    Directories are searched recursively and glob patterns are expanded,
+    keeping only supported file types; files and URLs are kept as given.
+
+    Args:
+        inputs: Files, directories, glob patterns or URLs
+
+    Returns:
+        Sources in input order (directory and glob matches sorted)
+    """
+    sources = []
+    seen = set()
+
+    def add(source: str) -> None:
+        if source not in seen:
+            seen.add(source)
+            sources.append(source)
+
+    for item in inputs:
+        if is_url(item):
+            add(item)
+        elif os.path.isdir(item):
+            matches = []
+            for current, dirs, files in os.walk(item):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                matches.extend(
+                    os.path.join(current, name) for name in files
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS)
+                )
+            for match in sorted(matches):
+                add(os.path.abspath(match))
+        elif glob.has_magic(item):
+            for match in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(match) and match.lower().endswith(SUPPORTED_EXTENSIONS):
+                    add(os.path.abspath(match))
+        else:
+            add(os.path.abspath(item) if os.path.exists(item) else item)
+
+    return sources
+
+
+def parse_stage_workers(spec: str) -> Dict[str, int]:
+    """
+    Parse a stage worker spec such as 'extract=8,generate=2'.
+
+    Raises:
+        ValueError: On unknown stages or non-positive counts
+    """
+    workers = {}
+    for part in filter(None, (p.strip() for p in spec.split(','))):
+        stage, _, count = part.partition('=')
+        stage = stage.strip()
+        if stage not in PIPELINE_STAGES:
+            raise ValueError(f"unknown stage '{stage}' (expected one of: {', '.join(PIPELINE_STAGES)})")
+        if not count.strip().isdigit() or int(count) < 1:
+            raise ValueError(f"invalid worker count for '{stage}': {count!r}")
+        workers[stage] = int(count)
+    return workers
+
+
+def corpus_output_dir(output_root: str, source: str) -> str:
+    """Return a stable, collision-free output directory for a corpus source"""
+    name = urlparse(source).path.rstrip('/') if is_url(source) else source
+    stem = re.sub(r'[^A-Za-z0-9_-]+', '-', Path(name).stem).strip('-') or 'source'
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(output_root, f"{stem[:60]}-{digest}")
+
+
+def load_completed_sources(results_path: str) -> set:
+    """Return sources recorded as successful in a corpus results file"""
+    completed = set()
+    try:
+        with open(results_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A run killed mid-write can leave a truncated last line
+                    continue
+                if entry.get('success'):
+                    completed.add(entry.get('source'))
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+# Orchestrator owned by each corpus worker process
+_WORKER_ORCHESTRATOR: Optional[ArticleToPrototype] = None
+
+
+def _init_corpus_worker(cache_dir: Optional[str], use_cache: bool, offline: bool) -> None:
+    """Build the per-process orchestrator (PDF pages and code blocks are
+    processed serially since the corpus pool already uses every core)"""
+    global _WORKER_ORCHESTRATOR
+    _WORKER_ORCHESTRATOR = ArticleToPrototype(
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+        offline=offline,
+        pdf_workers=1,
+        code_workers=1
+    )
+
+
+def _process_corpus_item(
+    source: str,
+    output_dir: str,
+    language_hint: Optional[str],
+    orchestrator: Optional[ArticleToPrototype] = None
+) -> Dict[str, Any]:
+    """
+    Run the pipeline for one corpus source.
+
+    Returns:
+        JSON-serializable result entry (never raises)
+    """
+    start = time.perf_counter()
+    orchestrator = orchestrator or _WORKER_ORCHESTRATOR
+    try:
+        result = orchestrator.process(source, output_dir, language_hint)
+    except Exception as e:
+        result = {'success': False, 'error': str(e), 'error_type': type(e).__name__}
+
+    return {
+        'source': source,
+        'output_dir': output_dir,
+        'seconds': round(time.perf_counter() - start, 3),
+        **result,
+    }
+
 
 def main():
     """Command-line interface"""
@@ -164,8 +622,11 @@ def main():
         description='Extract algorithms from articles and generate prototypes'
     )
     parser.add_argument(
-        'source',
-        help='Path to PDF, URL, notebook, or markdown file'
+        'sources',
+        nargs='+',
+        metavar='source',
+        help='Path to PDF, URL, notebook, or markdown file; several sources, '
+             'directories or glob patterns run in corpus mode'
     )
     parser.add_argument(
         '-o', '--output',
@@ -176,6 +637,61 @@ def main():
         '-l', '--language',
         help='Target programming language (auto-detected if not specified)'
     )
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache directory for extractions and web pages (default: ~/.cache/article-to-prototype)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-extract documents and re-download pages instead of using the caches'
+    )
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Serve web pages only from the HTTP cache (no network access)'
+    )
+    parser.add_argument(
+        '--pdf-workers',
+        type=int,
+        help='Extract the pages of a large PDF in this many processes (default: 1; '
+             'corpus runs with several workers or --pipeline always extract serially)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Corpus mode: worker processes (default: CPU count)'
+    )
+    parser.add_argument(
+        '--results',
+        help=f'Corpus mode: JSONL results file (default: OUTPUT/{CORPUS_RESULTS_FILENAME})'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Corpus mode: run stages concurrently in one process with bounded queues'
+    )
+    parser.add_argument(
+        '--stage-workers',
+        default='',
+        help='Corpus mode with --pipeline: threads per stage, e.g. extract=8,generate=2'
+    )
+    parser.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='Corpus mode: reprocess sources already recorded as successful'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Trace memory per stage, print stage metrics and dump cProfile stats '
+             '(covers the main process; use --workers 1 for corpus runs; '
+             'no per-stage memory with --pipeline)'
+    )
+    parser.add_argument(
+        '--profile-output',
+        help='pstats file written by --profile (default: OUTPUT/profile.pstats)'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -189,14 +705,71 @@ def main():
 
     args = parser.parse_args()
 
+    try:
+        stage_workers = parse_stage_workers(args.stage_workers)
+    except ValueError as e:
+        parser.error(f"--stage-workers: {e}")
+
+    if args.offline and args.no_cache:
+        parser.error('--offline cannot be combined with --no-cache')
+
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Process
-    orchestrator = ArticleToPrototype()
+    orchestrator = ArticleToPrototype(
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        offline=args.offline,
+        pdf_workers=args.pdf_workers
+    )
+
+    profiler = None
+    if args.profile:
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        return _run_cli(args, orchestrator, stage_workers)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            tracemalloc.stop()
+            profile_path = args.profile_output or os.path.join(args.output, 'profile.pstats')
+            os.makedirs(os.path.dirname(os.path.abspath(profile_path)), exist_ok=True)
+            profiler.dump_stats(profile_path)
+            print(f"\n{format_profile(profiler)}")
+            print(f"Profile written to: {profile_path} (inspect with: python -m pstats {profile_path})")
+
+
+def _run_cli(args: argparse.Namespace, orchestrator: ArticleToPrototype, stage_workers: Dict[str, int]) -> int:
+    """Run single-source or corpus mode and print the outcome"""
+    source = args.sources[0]
+    corpus_mode = (
+        len(args.sources) > 1
+        or os.path.isdir(source)
+        or (not is_url(source) and glob.has_magic(source) and not os.path.exists(source))
+    )
+    if corpus_mode:
+        summary = orchestrator.process_corpus(
+            args.sources,
+            args.output,
+            language_hint=args.language,
+            workers=args.workers,
+            results_path=args.results,
+            resume=not args.no_resume,
+            pipelined=args.pipeline,
+            stage_workers=stage_workers
+        )
+        print(f"\nProcessed {summary['total']} sources: {summary['succeeded']} succeeded, "
+              f"{summary['failed']} failed, {summary['skipped']} already done")
+        print(f"Results: {summary['results_path']}")
+        return 1 if summary['failed'] else 0
+
     result = orchestrator.process(
-        source=args.source,
+        source=source,
         output_dir=args.output,
         language_hint=args.language
     )
@@ -211,6 +784,8 @@ def main():
         print(f"Complexity: {result['complexity']}")
         print(f"Algorithms detected: {result['num_algorithms']}")
         print(f"Files created: {len(result['files_created'])}")
+        if args.profile:
+            print(f"\n{format_metrics(result['metrics'])}")
         print(f"\nTo run:")
         print(f"  cd {result['output_dir']}")
         print(f"  # Follow README.md instructions")
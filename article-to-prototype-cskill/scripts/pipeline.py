@@ -0,0 +1,158 @@
+"""
+Staged Pipeline
+
+Runs items through a sequence of stages connected by bounded queues. Each
+stage has its own pool of worker threads, so an I/O-bound stage (fetching
+web pages) overlaps with CPU-bound ones (parsing, analysis), and a slow
+stage applies backpressure to the stages before it instead of letting
+work pile up in memory.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Items allowed to wait between two stages
+DEFAULT_QUEUE_SIZE = 8
+
+# Seconds between checks for cancellation while blocked on a queue
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One pipeline step: func maps an item's value to its next value"""
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class PipelineItem:
+    """An item moving through the pipeline"""
+    index: int
+    value: Any
+    error: Optional[BaseException] = None
+    failed_stage: Optional[str] = None
+
+
+class StagedPipeline:
+    """Bounded-queue pipeline with per-stage thread pools"""
+
+    def __init__(self, stages: List[Stage], queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in execution order
+            queue_size: Capacity of each inter-stage queue
+        """
+        if not stages:
+            raise ValueError("pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"stage '{stage.name}' needs at least one worker")
+        self.stages = stages
+        self.queue_size = queue_size
+
+    def run(self, values: Iterable[Any]) -> Iterator[PipelineItem]:
+        """
+        Push values through every stage.
+
+        An exception in a stage marks that item as failed; it skips the
+        remaining stages and the pipeline keeps going. Closing the
+        returned iterator early stops all workers.
+
+        Args:
+            values: Input values (consumed lazily as the first stage has room)
+
+        Yields:
+            PipelineItem per input, in completion order
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        stop = threading.Event()
+        remaining = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+        threads = []
+
+        def put(q: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q: queue.Queue) -> Any:
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+            return _DONE
+
+        def feed():
+            try:
+                for index, value in enumerate(values):
+                    if not put(queues[0], PipelineItem(index=index, value=value)):
+                        return
+            except Exception as e:
+                logger.error(f"Pipeline input failed: {e}")
+            for _ in range(self.stages[0].workers):
+                put(queues[0], _DONE)
+
+        def work(position: int):
+            stage = self.stages[position]
+            inbox, outbox = queues[position], queues[position + 1]
+
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    break
+                if item.error is None:
+                    try:
+                        item.value = stage.func(item.value)
+                    except Exception as e:
+                        item.error = e
+                        item.failed_stage = stage.name
+                if not put(outbox, item):
+                    return
+
+            # The last worker of a stage tells the next stage it is done
+            with lock:
+                remaining[position] -= 1
+                last = remaining[position] == 0
+            if last:
+                next_workers = (
+                    self.stages[position + 1].workers
+                    if position + 1 < len(self.stages) else 1
+                )
+                for _ in range(next_workers):
+                    put(outbox, _DONE)
+
+        threads.append(threading.Thread(target=feed, name='pipeline-feed', daemon=True))
+        for position, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=work, args=(position,), name=f'pipeline-{stage.name}-{n}', daemon=True
+                ))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = get(queues[-1])
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
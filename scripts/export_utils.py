@@ -6,13 +6,23 @@ Packages Claude Code skills for Desktop/Web/API use with versioning and validati
 """
 
 import os
+import re
 import sys
+import stat
 import zipfile
+import zlib
+import io
 import json
+import time
+import hashlib
 import subprocess
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
+
+from frontmatter_parser import Frontmatter, load_frontmatter
 
 # Directories and files to exclude from exports
 EXCLUDE_DIRS = {
@@ -26,22 +36,265 @@ EXCLUDE_FILES = {
     '.env', 'credentials.json', '*.log', '.python-version'
 }
 
+# Files that must never be exported, even if a .gitignore re-includes them
+SENSITIVE_FILES = {'.env', 'credentials.json', 'secrets.json', 'api_keys.json'}
+
 # API package size limit (8MB per Claude API requirements)
 MAX_API_SIZE_MB = 8
 MAX_API_SIZE_BYTES = MAX_API_SIZE_MB * 1024 * 1024
 
+# Pre-flight size estimation for API packages
+ESTIMATE_SAMPLE_BYTES = 64 * 1024        # bytes read per sampled file
+ESTIMATE_SAMPLES_PER_TYPE = 3            # files sampled per extension
+ESTIMATE_TOLERANCE = 0.10                # relative error margin of the estimate
+ZIP_ENTRY_OVERHEAD = 76                  # local header + central directory bytes per entry
+
+# Extensions that are already compressed and gain nothing from deflate
+INCOMPRESSIBLE_EXTENSIONS = {
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.whl',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.mp4'
+}
+
+# Budget mode prunes files under these directories, first entry first.
+# Files outside them (SKILL.md, scripts/, requirements.txt) are never pruned.
+PRUNE_ORDER = ['examples', 'references', 'docs', 'assets', 'templates']
+
+# Bulk export bookkeeping (written to the bulk output directory)
+BULK_STATE_FILENAME = '.export_state.json'
+BULK_REPORT_FILENAME = 'bulk_export_report.json'
+
 # SKILL.md validation limits
 MAX_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024
 
 
-def get_skill_version(skill_path: str, override_version: str = None) -> str:
+def read_skill_frontmatter(skill_path: str) -> Optional[Frontmatter]:
+    """
+    Read and parse the frontmatter of a skill's SKILL.md (cached per mtime).
+
+    Args:
+        skill_path: Path to skill directory
+
+    Returns:
+        Frontmatter (with 'error' set if it is missing, malformed or
+        unreadable), or None if SKILL.md does not exist
+    """
+    skill_md_path = os.path.join(skill_path, 'SKILL.md')
+    if not os.path.exists(skill_md_path):
+        return None
+
+    try:
+        frontmatter = load_frontmatter(skill_md_path)
+    except Exception as e:
+        return Frontmatter(error=f"Error reading SKILL.md: {str(e)}")
+
+    if frontmatter.error:
+        return Frontmatter(body=frontmatter.body, error=f"SKILL.md {frontmatter.error}")
+    return frontmatter
+
+
+def _find_git_dirs(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Locate the git directory containing a path.
+
+    Returns:
+        Tuple of (git_dir, common_dir) - they differ for worktrees - or None
+    """
+    current = os.path.abspath(path)
+    while True:
+        candidate = os.path.join(current, '.git')
+        git_dir = None
+        if os.path.isdir(candidate):
+            git_dir = candidate
+        elif os.path.isfile(candidate):
+            # Worktrees and submodules: ".git" file pointing elsewhere
+            try:
+                with open(candidate, 'r', encoding='utf-8') as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if line.startswith('gitdir:'):
+                git_dir = os.path.normpath(os.path.join(current, line[7:].strip()))
+
+        if git_dir:
+            common_dir = git_dir
+            try:
+                with open(os.path.join(git_dir, 'commondir'), 'r', encoding='utf-8') as f:
+                    common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+            except OSError:
+                pass
+            return git_dir, common_dir
+
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _read_packed_refs(common_dir: str) -> List[Tuple[str, str, Optional[str]]]:
+    """Parse packed-refs into (ref, sha, peeled_sha) entries"""
+    entries = []
+    try:
+        with open(os.path.join(common_dir, 'packed-refs'), 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                if line.startswith('^'):
+                    if entries:
+                        ref, sha, _ = entries[-1]
+                        entries[-1] = (ref, sha, line[1:])
+                    continue
+                sha, _, ref = line.partition(' ')
+                entries.append((ref, sha, None))
+    except OSError:
+        pass
+    return entries
+
+
+def _resolve_ref(git_dir: str, common_dir: str, ref: str, packed: List[Tuple[str, str, Optional[str]]]) -> Optional[str]:
+    """Resolve a (possibly symbolic) ref to a commit sha"""
+    for _ in range(10):
+        for base in (git_dir, common_dir):
+            try:
+                with open(os.path.join(base, ref), 'r', encoding='utf-8') as f:
+                    value = f.read().strip()
+                break
+            except OSError:
+                continue
+        else:
+            return next((sha for name, sha, _ in packed if name == ref), None)
+
+        if value.startswith('ref:'):
+            ref = value[4:].strip()
+            continue
+        return value
+    return None
+
+
+def _peel_loose_tag(common_dir: str, sha: str) -> Optional[str]:
+    """
+    Return the commit an annotated tag object points to.
+
+    Returns the sha itself for lightweight tags, or None if the object is
+    packed and cannot be read without git.
+    """
+    object_path = os.path.join(common_dir, 'objects', sha[:2], sha[2:])
+    try:
+        with open(object_path, 'rb') as f:
+            data = zlib.decompress(f.read())
+    except (OSError, zlib.error):
+        return None
+
+    header, _, body = data.partition(b'\0')
+    if not header.startswith(b'tag '):
+        return sha
+    for line in body.split(b'\n'):
+        if line.startswith(b'object '):
+            return line[7:].decode('ascii')
+        if not line:
+            break
+    return None
+
+
+def _read_tags(common_dir: str, packed: List[Tuple[str, str, Optional[str]]]) -> Dict[str, Tuple[str, Optional[str]]]:
+    """
+    Collect tags as {name: (sha, peeled_commit_or_None)}.
+
+    Loose refs override packed ones, as in git.
+    """
+    tags = {}
+    for ref, sha, peeled in packed:
+        if ref.startswith('refs/tags/'):
+            tags[ref[10:]] = (sha, peeled or sha)
+
+    tags_dir = os.path.join(common_dir, 'refs', 'tags')
+    for root, _, files in os.walk(tags_dir):
+        for file in files:
+            tag_path = os.path.join(root, file)
+            try:
+                with open(tag_path, 'r', encoding='utf-8') as f:
+                    sha = f.read().strip()
+            except OSError:
+                continue
+            name = os.path.relpath(tag_path, tags_dir).replace(os.sep, '/')
+            tags[name] = (sha, _peel_loose_tag(common_dir, sha))
+    return tags
+
+
+def _version_sort_key(tag: str) -> List:
+    """Sort key that orders v1.10.0 after v1.9.0"""
+    return [(0, int(part), '') if part.isdigit() else (1, 0, part) for part in re.split(r'(\d+)', tag)]
+
+
+# git describe results keyed by (common_dir, HEAD sha, tag snapshot)
+_GIT_DESCRIBE_CACHE: Dict[Tuple, Optional[str]] = {}
+
+
+def resolve_git_version(skill_path: str) -> Optional[str]:
+    """
+    Find the most recent git tag for a skill without spawning git when possible.
+
+    Reads HEAD, loose refs and packed-refs directly. A tag on the HEAD
+    commit is returned immediately; repositories without tags return None
+    immediately. Only when HEAD is untagged but tags exist does this run
+    'git describe', and that result is cached per HEAD and tag snapshot.
+
+    Args:
+        skill_path: Path to skill directory
+
+    Returns:
+        Tag name, or None if no tag applies
+    """
+    dirs = _find_git_dirs(skill_path)
+    if dirs is None:
+        return None
+    git_dir, common_dir = dirs
+
+    packed = _read_packed_refs(common_dir)
+    head = _resolve_ref(git_dir, common_dir, 'HEAD', packed)
+    if not head:
+        return None
+
+    tags = _read_tags(common_dir, packed)
+    if not tags:
+        return None
+
+    at_head = [name for name, (_, commit) in tags.items() if commit == head]
+    if at_head:
+        return max(at_head, key=_version_sort_key)
+
+    cache_key = (common_dir, head, frozenset(tags.items()))
+    if cache_key not in _GIT_DESCRIBE_CACHE:
+        version = None
+        try:
+            result = subprocess.run(
+                ['git', 'describe', '--tags', '--abbrev=0'],
+                cwd=skill_path,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            if result.returncode == 0:
+                version = result.stdout.strip() or None
+        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+            pass
+        _GIT_DESCRIBE_CACHE[cache_key] = version
+    return _GIT_DESCRIBE_CACHE[cache_key]
+
+
+def get_skill_version(
+    skill_path: str,
+    override_version: str = None,
+    frontmatter: Optional[Frontmatter] = None
+) -> str:
     """
     Determine skill version from git tags, SKILL.md, or use default.
 
     Args:
         skill_path: Path to skill directory
         override_version: User-specified version (takes precedence)
+        frontmatter: Already parsed SKILL.md frontmatter (optional)
 
     Returns:
         Version string in format "vX.Y.Z"
@@ -50,48 +303,31 @@ def get_skill_version(skill_path: str, override_version: str = None) -> str:
         return override_version if override_version.startswith('v') else f'v{override_version}'
 
     # Try git tags first
-    try:
-        os.chdir(skill_path)
-        result = subprocess.run(
-            ['git', 'describe', '--tags', '--abbrev=0'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            version = result.stdout.strip()
-            return version if version.startswith('v') else f'v{version}'
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        pass
+    version = resolve_git_version(skill_path)
+    if version:
+        return version if version.startswith('v') else f'v{version}'
 
     # Try SKILL.md frontmatter
-    skill_md_path = os.path.join(skill_path, 'SKILL.md')
-    if os.path.exists(skill_md_path):
-        try:
-            with open(skill_md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Look for version: in frontmatter
-                if content.startswith('---'):
-                    frontmatter_end = content.find('---', 3)
-                    if frontmatter_end > 0:
-                        frontmatter = content[3:frontmatter_end]
-                        for line in frontmatter.split('\n'):
-                            if line.strip().startswith('version:'):
-                                version = line.split(':', 1)[1].strip()
-                                return version if version.startswith('v') else f'v{version}'
-        except Exception:
-            pass
+    if frontmatter is None:
+        frontmatter = read_skill_frontmatter(skill_path)
+    if frontmatter and frontmatter.version:
+        version = frontmatter.version
+        return version if version.startswith('v') else f'v{version}'
 
     # Default version
     return 'v1.0.0'
 
 
-def validate_skill_structure(skill_path: str) -> Tuple[bool, List[str]]:
+def validate_skill_structure(
+    skill_path: str,
+    frontmatter: Optional[Frontmatter] = None
+) -> Tuple[bool, List[str]]:
     """
     Validate that skill has required structure for export.
 
     Args:
         skill_path: Path to skill directory
+        frontmatter: Already parsed SKILL.md frontmatter (optional)
 
     Returns:
         Tuple of (is_valid, list_of_issues)
@@ -108,58 +344,176 @@ def validate_skill_structure(skill_path: str) -> Tuple[bool, List[str]]:
         return False, issues
 
     # Check for SKILL.md
-    skill_md_path = os.path.join(skill_path, 'SKILL.md')
-    if not os.path.exists(skill_md_path):
+    if frontmatter is None:
+        frontmatter = read_skill_frontmatter(skill_path)
+    if frontmatter is None:
         issues.append("SKILL.md not found (required)")
         return False, issues
 
     # Validate SKILL.md frontmatter
-    try:
-        with open(skill_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    if frontmatter.error:
+        issues.append(frontmatter.error)
+        return False, issues
 
-            if not content.startswith('---'):
-                issues.append("SKILL.md missing frontmatter (must start with ---)")
-            else:
-                # Extract frontmatter
-                frontmatter_end = content.find('---', 3)
-                if frontmatter_end == -1:
-                    issues.append("SKILL.md frontmatter not closed (missing second ---)")
-                else:
-                    frontmatter = content[3:frontmatter_end]
-
-                    # Check for required fields
-                    has_name = False
-                    has_description = False
-                    name_length = 0
-                    desc_length = 0
-
-                    for line in frontmatter.split('\n'):
-                        line = line.strip()
-                        if line.startswith('name:'):
-                            has_name = True
-                            name = line.split(':', 1)[1].strip()
-                            name_length = len(name)
-                            if name_length > MAX_NAME_LENGTH:
-                                issues.append(f"name too long: {name_length} chars (max {MAX_NAME_LENGTH})")
-                        elif line.startswith('description:'):
-                            has_description = True
-                            desc = line.split(':', 1)[1].strip()
-                            desc_length = len(desc)
-                            if desc_length > MAX_DESCRIPTION_LENGTH:
-                                issues.append(f"description too long: {desc_length} chars (max {MAX_DESCRIPTION_LENGTH})")
-
-                    if not has_name:
-                        issues.append("SKILL.md missing 'name:' field in frontmatter")
-                    if not has_description:
-                        issues.append("SKILL.md missing 'description:' field in frontmatter")
+    name = frontmatter.name
+    if name is None:
+        issues.append("SKILL.md missing 'name:' field in frontmatter")
+    elif len(name) > MAX_NAME_LENGTH:
+        issues.append(f"name too long: {len(name)} chars (max {MAX_NAME_LENGTH})")
 
-    except Exception as e:
-        issues.append(f"Error reading SKILL.md: {str(e)}")
+    description = frontmatter.description
+    if description is None:
+        issues.append("SKILL.md missing 'description:' field in frontmatter")
+    elif len(description) > MAX_DESCRIPTION_LENGTH:
+        issues.append(f"description too long: {len(description)} chars (max {MAX_DESCRIPTION_LENGTH})")
 
     return len(issues) == 0, issues
 
 
+def _glob_to_regex(pattern: str) -> str:
+    """
+    Translate a gitignore-style glob (without anchoring) to a regex body.
+
+    '*' and '?' never cross '/', '**' spans directories.
+    """
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+            continue
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end
+        elif char == '\\' and i + 1 < len(pattern):
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return ''.join(parts)
+
+
+def _compile_rule(pattern: str, dir_only: bool = False, file_only: bool = False) -> Optional[Tuple[str, bool]]:
+    """
+    Compile one gitignore-style line into a regex matched against a path
+    relative to the skill root. Directory paths carry a trailing '/'.
+
+    Returns:
+        Tuple of (regex, negate), or None for blank lines and comments
+    """
+    pattern = pattern.rstrip()
+    if not pattern or pattern.startswith('#'):
+        return None
+
+    negate = pattern.startswith('!')
+    if negate:
+        pattern = pattern[1:]
+    if pattern.startswith('\\'):
+        pattern = pattern[1:]
+
+    if pattern.endswith('/'):
+        dir_only = True
+        pattern = pattern.rstrip('/')
+    if not pattern:
+        return None
+
+    # Patterns containing a slash are anchored to the root, others match at any depth
+    if '/' in pattern:
+        prefix = ''
+        pattern = pattern.lstrip('/')
+    else:
+        prefix = '(?:.*/)?'
+
+    if dir_only:
+        suffix = '/'
+    elif file_only:
+        suffix = ''
+    else:
+        suffix = '/?'
+
+    return f'{prefix}{_glob_to_regex(pattern)}{suffix}', negate
+
+
+class ExclusionMatcher:
+    """
+    Compiled export exclusion rules with gitignore semantics.
+
+    Built-in rules (EXCLUDE_DIRS, EXCLUDE_FILES, SENSITIVE_FILES) are folded
+    into one regex and always win. Rules from a skill's .gitignore are
+    applied after them in file order, last match wins, so '!pattern' lines
+    re-include files ignored by earlier .gitignore lines. Paths are relative
+    to the skill root, use '/' separators and end in '/' for directories.
+    """
+
+    def __init__(self, ignore_lines: Optional[List[str]] = None):
+        builtin = [_compile_rule(pattern, dir_only=True) for pattern in EXCLUDE_DIRS]
+        builtin += [_compile_rule(pattern, file_only=True) for pattern in EXCLUDE_FILES | SENSITIVE_FILES]
+        self._builtin = re.compile('(?:' + '|'.join(regex for regex, _ in builtin) + r')\Z')
+
+        rules = [rule for rule in map(_compile_rule, ignore_lines or []) if rule]
+        self._has_negation = any(negate for _, negate in rules)
+        self._rules = [(re.compile(regex + r'\Z'), negate) for regex, negate in rules]
+        self._ignore_any = (
+            re.compile('(?:' + '|'.join(regex for regex, negate in rules if not negate) + r')\Z')
+            if any(not negate for _, negate in rules) else None
+        )
+
+    @classmethod
+    def for_skill(cls, skill_path: str) -> 'ExclusionMatcher':
+        """Build a matcher from the built-in rules plus the skill's .gitignore"""
+        gitignore_path = os.path.join(skill_path, '.gitignore')
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8') as f:
+                return cls(f.read().splitlines())
+        except OSError:
+            return cls()
+
+    def is_excluded(self, rel_path: str) -> bool:
+        """
+        Check a path relative to the skill root.
+
+        Args:
+            rel_path: '/'-separated relative path, with a trailing '/' for directories
+
+        Returns:
+            True if the path must not be exported
+        """
+        if self._builtin.match(rel_path):
+            return True
+        if self._ignore_any is None or not self._ignore_any.match(rel_path):
+            return False
+        if not self._has_negation:
+            return True
+
+        excluded = False
+        for regex, negate in self._rules:
+            if regex.match(rel_path):
+                excluded = not negate
+        return excluded
+
+
+# Built-in rules only, for callers without a skill root
+_DEFAULT_MATCHER = ExclusionMatcher()
+
+
 def should_include_file(file_path: str, filename: str) -> bool:
     """
     Determine if a file should be included in export.
@@ -171,22 +525,50 @@ def should_include_file(file_path: str, filename: str) -> bool:
     Returns:
         True if file should be included
     """
-    # Check excluded filenames
-    if filename in EXCLUDE_FILES:
-        return False
+    return not _DEFAULT_MATCHER.is_excluded(filename)
+
+
+def walk_skill_files(
+    skill_path: str,
+    matcher: Optional[ExclusionMatcher] = None
+) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Walk a skill directory with os.scandir, skipping excluded paths.
 
-    # Check excluded patterns
-    for pattern in EXCLUDE_FILES:
-        if '*' in pattern:
-            extension = pattern.replace('*', '')
-            if filename.endswith(extension):
-                return False
+    Excluded directories are never descended into and each included file
+    costs exactly one stat call.
 
-    # Check for sensitive files
-    if filename in {'.env', 'credentials.json', 'secrets.json', 'api_keys.json'}:
-        return False
+    Args:
+        skill_path: Skill directory
+        matcher: Exclusion rules (default: built-ins plus the skill's .gitignore)
+
+    Yields:
+        Tuples of (relative_path, stat_result) for every included file
+    """
+    if matcher is None:
+        matcher = ExclusionMatcher.for_skill(skill_path)
 
-    return True
+    pending = ['']
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(skill_path, rel_dir) if rel_dir else skill_path) as entries:
+                for entry in entries:
+                    rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not matcher.is_excluded(rel_path + '/'):
+                                pending.append(rel_path)
+                            continue
+                        if matcher.is_excluded(rel_path):
+                            continue
+                        entry_stat = entry.stat()
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(entry_stat.st_mode):
+                        yield rel_path, entry_stat
+        except OSError:
+            continue
 
 
 def get_directory_size(path: str) -> int:
@@ -199,18 +581,168 @@ def get_directory_size(path: str) -> int:
     Returns:
         Total size in bytes
     """
-    total = 0
-    for root, dirs, files in os.walk(path):
-        # Filter excluded directories
-        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
+    return sum(file_stat.st_size for _, file_stat in walk_skill_files(path))
 
-        for file in files:
-            if should_include_file(os.path.join(root, file), file):
-                try:
-                    total += os.path.getsize(os.path.join(root, file))
-                except OSError:
-                    pass
-    return total
+
+def _iter_package_files(skill_path: str, variant: str):
+    """
+    Yield the files that belong in an export package.
+
+    Args:
+        skill_path: Path to skill directory
+        variant: 'desktop' or 'api'
+
+    Yields:
+        Tuples of (file_path, arcname, stat_result)
+    """
+    for arcname, file_stat in walk_skill_files(skill_path):
+        # For API variant, apply additional filtering
+        if variant == 'api':
+            filename = arcname.rsplit('/', 1)[-1]
+            # Skip large documentation files
+            if filename.endswith('.md') and filename not in {'SKILL.md', 'README.md'}:
+                continue
+            # Skip example files
+            if 'examples' in arcname.lower():
+                continue
+
+        yield os.path.join(skill_path, arcname), arcname, file_stat
+
+
+def _sample_compression_ratio(file_paths: List[str]) -> float:
+    """
+    Estimate the deflate ratio of a file type from a few sampled files.
+
+    Args:
+        file_paths: Files sharing one extension
+
+    Returns:
+        Compressed/raw size ratio between 0 and 1
+    """
+    raw_total = 0
+    compressed_total = 0
+    for file_path in file_paths[:ESTIMATE_SAMPLES_PER_TYPE]:
+        try:
+            with open(file_path, 'rb') as f:
+                sample = f.read(ESTIMATE_SAMPLE_BYTES)
+        except OSError:
+            continue
+        raw_total += len(sample)
+        compressed_total += len(zlib.compress(sample, 9))
+
+    if raw_total == 0:
+        return 1.0
+    return min(1.0, compressed_total / raw_total)
+
+
+def estimate_compressed_size(
+    skill_path: str,
+    variant: str = 'api',
+    package_files: List[Tuple[str, str, os.stat_result]] = None
+) -> Dict:
+    """
+    Predict the size of an export package without building it.
+
+    Uses file stats plus compression ratios sampled per file extension, so
+    the cost is one stat per file and at most a few small reads per type.
+
+    Args:
+        skill_path: Path to skill directory
+        variant: 'desktop' or 'api'
+        package_files: Precomputed _iter_package_files() entries (optional)
+
+    Returns:
+        Dict with 'estimated_bytes', 'raw_bytes', 'ratios' (per extension)
+        and 'files' (per-file 'arcname', 'size', 'estimated_bytes')
+    """
+    if package_files is None:
+        package_files = list(_iter_package_files(skill_path, variant))
+
+    # Group files by extension, largest first so samples are representative
+    sized_files = []
+    by_extension = {}
+    for file_path, arcname, file_stat in package_files:
+        size = file_stat.st_size
+        extension = os.path.splitext(arcname)[1].lower()
+        sized_files.append((file_path, arcname, size, extension))
+        by_extension.setdefault(extension, []).append((size, file_path))
+
+    ratios = {}
+    for extension, entries in by_extension.items():
+        if extension in INCOMPRESSIBLE_EXTENSIONS:
+            ratios[extension] = 1.0
+        else:
+            entries.sort(reverse=True)
+            ratios[extension] = _sample_compression_ratio([path for _, path in entries])
+
+    files = []
+    raw_bytes = 0
+    estimated_bytes = 0
+    for file_path, arcname, size, extension in sized_files:
+        file_estimate = int(size * ratios[extension]) + ZIP_ENTRY_OVERHEAD + 2 * len(arcname)
+        files.append({'arcname': arcname, 'size': size, 'estimated_bytes': file_estimate})
+        raw_bytes += size
+        estimated_bytes += file_estimate
+
+    return {
+        'estimated_bytes': estimated_bytes,
+        'raw_bytes': raw_bytes,
+        'ratios': ratios,
+        'files': files
+    }
+
+
+def _prune_rank(arcname: str) -> Optional[int]:
+    """
+    Rank a file for budget pruning.
+
+    Args:
+        arcname: Path of the file inside the package
+
+    Returns:
+        Index into PRUNE_ORDER (lower is pruned first), or None if the file
+        must be kept
+    """
+    parts = arcname.lower().split('/')[:-1]
+    for rank, directory in enumerate(PRUNE_ORDER):
+        if directory in parts:
+            return rank
+    return None
+
+
+def prune_to_budget(files: List[Dict], budget_bytes: int) -> Tuple[List[Dict], List[str]]:
+    """
+    Drop lowest-priority files until the estimated package fits a budget.
+
+    Files are dropped in PRUNE_ORDER, largest first within each rank, so the
+    fewest files are removed. Essential files are never dropped.
+
+    Args:
+        files: Per-file entries from estimate_compressed_size()
+        budget_bytes: Maximum estimated package size
+
+    Returns:
+        Tuple of (kept_files, pruned_arcnames)
+    """
+    total = sum(entry['estimated_bytes'] for entry in files)
+
+    candidates = []
+    for entry in files:
+        rank = _prune_rank(entry['arcname'])
+        if rank is not None:
+            candidates.append((rank, -entry['estimated_bytes'], entry['arcname']))
+    candidates.sort()
+
+    pruned = []
+    for _, negative_size, arcname in candidates:
+        if total <= budget_bytes:
+            break
+        total += negative_size
+        pruned.append(arcname)
+
+    pruned_names = set(pruned)
+    kept = [entry for entry in files if entry['arcname'] not in pruned_names]
+    return kept, pruned
 
 
 def create_export_package(
@@ -218,20 +750,27 @@ def create_export_package(
     output_dir: str,
     variant: str = 'desktop',
     version: str = 'v1.0.0',
-    skill_name: str = None
+    skill_name: str = None,
+    fit_to_budget: bool = False
 ) -> Dict:
     """
     Create optimized export package for specified variant.
 
+    API packages are size-checked before compression: if the estimated size
+    exceeds the API limit the export fails fast, or, with fit_to_budget,
+    the lowest-priority files are pruned until the package fits.
+
     Args:
         skill_path: Path to skill directory
         output_dir: Where to save the .zip file
         variant: 'desktop' or 'api'
         version: Version string (e.g., 'v1.0.0')
         skill_name: Override skill name (default: directory name)
+        fit_to_budget: Prune examples/references to fit the API size limit
 
     Returns:
         Dict with 'success', 'zip_path', 'size_mb', 'files_included', 'message'
+        (plus 'estimated_size_mb' and 'files_pruned' for API packages)
     """
     if skill_name is None:
         skill_name = os.path.basename(os.path.abspath(skill_path))
@@ -241,62 +780,78 @@ def create_export_package(
     zip_path = os.path.join(output_dir, zip_filename)
 
     files_included = []
+    files_pruned = []
     total_size = 0
+    estimate = None
 
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
-            for root, dirs, files in os.walk(skill_path):
-                # Filter excluded directories
-                dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-
-                # For API variant, exclude .claude-plugin
-                if variant == 'api' and '.claude-plugin' in dirs:
-                    dirs.remove('.claude-plugin')
-
-                for file in files:
-                    if not should_include_file(os.path.join(root, file), file):
-                        continue
-
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, skill_path)
-
-                    # For API variant, apply additional filtering
-                    if variant == 'api':
-                        # Skip large documentation files
-                        if file.endswith('.md') and file not in {'SKILL.md', 'README.md'}:
-                            continue
-                        # Skip example files
-                        if 'examples' in arcname.lower():
-                            continue
+        package_files = list(_iter_package_files(skill_path, variant))
+
+        # Predict the compressed size before spending a full compression pass
+        if variant == 'api':
+            estimate = estimate_compressed_size(skill_path, variant, package_files)
+            if estimate['estimated_bytes'] > MAX_API_SIZE_BYTES * (1 + ESTIMATE_TOLERANCE):
+                if fit_to_budget:
+                    budget = int(MAX_API_SIZE_BYTES * (1 - ESTIMATE_TOLERANCE))
+                    kept, files_pruned = prune_to_budget(estimate['files'], budget)
+                    kept_names = {entry['arcname'] for entry in kept}
+                    package_files = [entry for entry in package_files if entry[1] in kept_names]
+                    estimate['estimated_bytes'] = sum(entry['estimated_bytes'] for entry in kept)
+                    if estimate['estimated_bytes'] > budget:
+                        estimated_mb = estimate['estimated_bytes'] / (1024 * 1024)
+                        return {
+                            'success': False,
+                            'zip_path': None,
+                            'size_mb': estimated_mb,
+                            'files_included': [],
+                            'files_pruned': files_pruned,
+                            'message': f"API package cannot fit budget: ~{estimated_mb:.2f} MB after pruning "
+                                       f"{len(files_pruned)} files (max {MAX_API_SIZE_MB} MB)"
+                        }
+                else:
+                    estimated_mb = estimate['estimated_bytes'] / (1024 * 1024)
+                    return {
+                        'success': False,
+                        'zip_path': None,
+                        'size_mb': estimated_mb,
+                        'files_included': [],
+                        'message': f"API package too large: ~{estimated_mb:.2f} MB estimated "
+                                   f"(max {MAX_API_SIZE_MB} MB). Re-run with --fit-budget to prune "
+                                   f"examples and references automatically"
+                    }
 
-                    try:
-                        zipf.write(file_path, arcname)
-                        files_included.append(arcname)
-                        total_size += os.path.getsize(file_path)
-                    except Exception as e:
-                        print(f"Warning: Could not add {arcname}: {e}", file=sys.stderr)
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+            for file_path, arcname, file_stat in package_files:
+                try:
+                    zipf.write(file_path, arcname)
+                    files_included.append(arcname)
+                    total_size += file_stat.st_size
+                except Exception as e:
+                    print(f"Warning: Could not add {arcname}: {e}", file=sys.stderr)
 
         # Check final size
         final_size = os.path.getsize(zip_path)
         size_mb = final_size / (1024 * 1024)
 
-        # Warn if API package is too large
-        if variant == 'api' and final_size > MAX_API_SIZE_BYTES:
-            return {
-                'success': False,
-                'zip_path': zip_path,
-                'size_mb': size_mb,
-                'files_included': files_included,
-                'message': f"API package too large: {size_mb:.2f} MB (max {MAX_API_SIZE_MB} MB)"
-            }
-
-        return {
+        result = {
             'success': True,
             'zip_path': zip_path,
             'size_mb': size_mb,
             'files_included': files_included,
             'message': f"Package created successfully: {len(files_included)} files, {size_mb:.2f} MB"
         }
+        if estimate is not None:
+            result['estimated_size_mb'] = estimate['estimated_bytes'] / (1024 * 1024)
+            result['files_pruned'] = files_pruned
+            if files_pruned:
+                result['message'] += f" ({len(files_pruned)} files pruned to fit budget)"
+
+        # Warn if API package is too large
+        if variant == 'api' and final_size > MAX_API_SIZE_BYTES:
+            result['success'] = False
+            result['message'] = f"API package too large: {size_mb:.2f} MB (max {MAX_API_SIZE_MB} MB)"
+
+        return result
 
     except Exception as e:
         return {
@@ -599,7 +1154,8 @@ def export_skill(
     skill_path: str,
     variants: List[str] = ['desktop', 'api'],
     version_override: str = None,
-    output_dir: str = None
+    output_dir: str = None,
+    fit_to_budget: bool = False
 ) -> Dict:
     """
     Main export function - validates, packages, and generates guides.
@@ -609,6 +1165,7 @@ def export_skill(
         variants: List of variants to create ('desktop', 'api', or both)
         version_override: User-specified version (optional)
         output_dir: Where to save exports (default: exports/ in parent dir)
+        fit_to_budget: Prune API package files to fit the size limit
 
     Returns:
         Dict with export results
@@ -628,7 +1185,8 @@ def export_skill(
 
     # Validate skill structure
     print("🔍 Validating skill structure...")
-    valid, issues = validate_skill_structure(skill_path)
+    frontmatter = read_skill_frontmatter(skill_path)
+    valid, issues = validate_skill_structure(skill_path, frontmatter)
     if not valid:
         return {
             'success': False,
@@ -638,7 +1196,7 @@ def export_skill(
     print("✅ Skill structure valid")
 
     # Determine version
-    version = get_skill_version(skill_path, version_override)
+    version = get_skill_version(skill_path, version_override, frontmatter)
     print(f"📌 Version: {version}")
 
     # Create packages
@@ -663,11 +1221,13 @@ def export_skill(
     if 'api' in variants:
         print(f"\n🔨 Creating API package...")
         api_result = create_export_package(
-            skill_path, output_dir, 'api', version, skill_name
+            skill_path, output_dir, 'api', version, skill_name, fit_to_budget
         )
         results['packages']['api'] = api_result
         if api_result['success']:
             print(f"✅ API package: {os.path.basename(api_result['zip_path'])} ({api_result['size_mb']:.2f} MB)")
+            if api_result.get('files_pruned'):
+                print(f"✂️  Pruned {len(api_result['files_pruned'])} files to fit the {MAX_API_SIZE_MB} MB budget")
         else:
             print(f"❌ API package failed: {api_result['message']}")
             results['success'] = False
@@ -688,25 +1248,247 @@ def export_skill(
     return results
 
 
+def discover_skills(root: str) -> List[str]:
+    """
+    Find all skill directories (containing SKILL.md) under a root.
+
+    Skill directories below the root are not searched further, so nested
+    examples inside a skill are not exported separately. The root itself is
+    never a result even if it has a SKILL.md, so a skill repository that
+    also holds other skills can be bulk-exported from its top level.
+
+    Args:
+        root: Directory to search
+
+    Returns:
+        Sorted list of absolute skill paths
+    """
+    skills = []
+    root = os.path.abspath(root)
+    for current, dirs, files in os.walk(root):
+        if 'SKILL.md' in files and current != root:
+            skills.append(current)
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS and d != 'exports']
+    return sorted(skills)
+
+
+def compute_skill_digest(skill_path: str) -> str:
+    """
+    Compute a content digest over every file that would be exported.
+
+    Args:
+        skill_path: Path to skill directory
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for file_path, arcname, _ in sorted(_iter_package_files(skill_path, 'desktop'), key=lambda item: item[1]):
+        digest.update(arcname.encode('utf-8') + b'\0')
+        try:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            continue
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _bulk_export_worker(
+    skill_path: str,
+    variants: List[str],
+    version_override: Optional[str],
+    output_dir: str,
+    fit_to_budget: bool,
+    previous: Optional[Dict]
+) -> Dict:
+    """
+    Export one skill for export_skills_bulk (runs in a worker process).
+
+    Returns:
+        Per-skill report entry
+    """
+    start = time.perf_counter()
+    entry = {
+        'name': os.path.basename(skill_path),
+        'path': skill_path,
+        'status': 'failed',
+        'packages': {},
+    }
+
+    try:
+        digest = compute_skill_digest(skill_path)
+        version = get_skill_version(skill_path, version_override)
+        entry['digest'] = digest
+        entry['version'] = version
+
+        # Skip skills whose content, version and variants are unchanged
+        if (previous
+                and previous.get('digest') == digest
+                and previous.get('version') == version
+                and sorted(previous.get('packages', {})) == sorted(variants)
+                and all(os.path.exists(package['zip_path'])
+                        for package in previous['packages'].values())):
+            entry['status'] = 'skipped'
+            entry['packages'] = previous['packages']
+            entry['seconds'] = time.perf_counter() - start
+            return entry
+
+        # Keep per-skill progress output out of the aggregated console log
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = export_skill(skill_path, variants, version, output_dir, fit_to_budget)
+
+        for variant, package in results.get('packages', {}).items():
+            if package['success']:
+                entry['packages'][variant] = {
+                    'zip_path': package['zip_path'],
+                    'size_mb': package['size_mb'],
+                    'files': len(package['files_included']),
+                }
+
+        if results['success']:
+            entry['status'] = 'exported'
+        else:
+            entry['message'] = results.get('message') or '; '.join(
+                package['message'] for package in results['packages'].values()
+                if not package['success']
+            )
+            if 'issues' in results:
+                entry['issues'] = results['issues']
+
+    except Exception as e:
+        entry['message'] = f"Error exporting skill: {str(e)}"
+
+    entry['seconds'] = time.perf_counter() - start
+    return entry
+
+
+def export_skills_bulk(
+    root: str,
+    variants: List[str] = ['desktop', 'api'],
+    version_override: str = None,
+    output_dir: str = None,
+    workers: int = None,
+    force: bool = False,
+    fit_to_budget: bool = False
+) -> Dict:
+    """
+    Validate and export every skill under a root directory in parallel.
+
+    Skills whose content digest, version and variants match the previous
+    bulk run are skipped. Writes an aggregated JSON report to output_dir.
+
+    Args:
+        root: Directory containing *-cskill directories
+        variants: List of variants to create ('desktop', 'api', or both)
+        version_override: User-specified version applied to every skill
+        output_dir: Where to save exports (default: exports/ under root)
+        workers: Worker process count (default: CPU count)
+        force: Re-export even when digests are unchanged
+        fit_to_budget: Prune API package files to fit the size limit
+
+    Returns:
+        Dict with 'success', 'report_path', 'skills' and summary counts
+    """
+    root = os.path.abspath(root)
+    if output_dir is None:
+        output_dir = os.path.join(root, 'exports')
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    state_path = os.path.join(output_dir, BULK_STATE_FILENAME)
+    state = {}
+    if not force and os.path.exists(state_path):
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+
+    skills = discover_skills(root)
+    start = time.perf_counter()
+    entries = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _bulk_export_worker, skill_path, variants, version_override,
+                output_dir, fit_to_budget, state.get(skill_path)
+            )
+            for skill_path in skills
+        ]
+        for future in as_completed(futures):
+            entry = future.result()
+            entries.append(entry)
+            icon = {'exported': '✅', 'skipped': '⏭️ ', 'failed': '❌'}[entry['status']]
+            print(f"{icon} {entry['name']}: {entry['status']} ({entry['seconds']:.2f}s)")
+
+    entries.sort(key=lambda entry: entry['name'])
+    counts = {status: sum(1 for entry in entries if entry['status'] == status)
+              for status in ('exported', 'skipped', 'failed')}
+
+    # Remember digests of successful exports for the next run
+    for entry in entries:
+        if entry['status'] in ('exported', 'skipped'):
+            state[entry['path']] = {
+                'digest': entry['digest'],
+                'version': entry['version'],
+                'packages': entry['packages'],
+            }
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+    report = {
+        'root': root,
+        'output_dir': output_dir,
+        'generated': datetime.now().isoformat(),
+        'total_seconds': time.perf_counter() - start,
+        'variants': variants,
+        **counts,
+        'skills': entries,
+    }
+    report_path = os.path.join(output_dir, BULK_REPORT_FILENAME)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    return {
+        'success': counts['failed'] == 0,
+        'report_path': report_path,
+        **counts,
+        'skills': entries,
+    }
+
+
 def main():
     """CLI interface for export_utils.py"""
     if len(sys.argv) < 2:
         print("""
 Usage: python export_utils.py <skill-path> [options]
+       python export_utils.py <root> --bulk [options]
 
 Arguments:
   skill-path              Path to skill directory
+  root                    Directory containing skills (with --bulk)
 
 Options:
   --variant VARIANT       Export variant: desktop, api, or both (default: both)
   --version VERSION       Override version (default: auto-detect)
   --output-dir DIR        Output directory (default: exports/)
+  --fit-budget            Prune examples/references until the API package fits
+  --bulk                  Export every skill found under the given root
+  --workers N             Parallel export processes for --bulk (default: CPU count)
+  --force                 Re-export unchanged skills with --bulk
 
 Examples:
   python export_utils.py ./my-skill-cskill
   python export_utils.py ./my-skill-cskill --variant desktop
   python export_utils.py ./my-skill-cskill --version 2.0.1
   python export_utils.py ./my-skill-cskill --variant api --output-dir ./dist
+  python export_utils.py ./my-skill-cskill --variant api --fit-budget
+  python export_utils.py ./references/examples --bulk --workers 4
 """)
         sys.exit(1)
 
@@ -716,6 +1498,10 @@ Examples:
     variants = ['desktop', 'api']  # default: both
     version_override = None
     output_dir = None
+    fit_to_budget = False
+    bulk = False
+    workers = None
+    force = False
 
     i = 2
     while i < len(sys.argv):
@@ -732,13 +1518,36 @@ Examples:
         elif sys.argv[i] == '--output-dir':
             output_dir = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == '--fit-budget':
+            fit_to_budget = True
+            i += 1
+        elif sys.argv[i] == '--bulk':
+            bulk = True
+            i += 1
+        elif sys.argv[i] == '--workers':
+            workers = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--force':
+            force = True
+            i += 1
         else:
             print(f"Unknown option: {sys.argv[i]}")
             sys.exit(1)
 
+    if bulk:
+        print(f"\n🚀 Bulk exporting skills under: {skill_path}\n")
+        results = export_skills_bulk(
+            skill_path, variants, version_override, output_dir, workers, force, fit_to_budget
+        )
+        print(f"\n{'='*60}")
+        print(f"Exported: {results['exported']}  Skipped: {results['skipped']}  Failed: {results['failed']}")
+        print(f"📄 Report: {results['report_path']}")
+        print(f"{'='*60}\n")
+        sys.exit(0 if results['success'] else 1)
+
     # Run export
     print(f"\n🚀 Exporting skill: {os.path.basename(skill_path)}\n")
-    results = export_skill(skill_path, variants, version_override, output_dir)
+    results = export_skill(skill_path, variants, version_override, output_dir, fit_to_budget)
 
     # Print summary
     print(f"\n{'='*60}")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Frontmatter Parser for Agent-Skill-Creator
+
+Parses the '---' delimited frontmatter of SKILL.md and other markdown files
+into a typed object. Recently parsed files are cached by path, mtime and
+size, so validation, versioning and extraction do not re-read them.
+"""
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+FRONTMATTER_DELIMITER = '---'
+
+# Parsed documents kept by load_frontmatter(); each entry holds the whole
+# body, so the least recently used ones are evicted beyond this count
+CACHE_MAX_ENTRIES = 128
+
+# Absolute path -> ((mtime_ns, size), Frontmatter), least recently used first
+_CACHE: 'OrderedDict[str, Tuple[Tuple[int, int], Frontmatter]]' = OrderedDict()
+
+
+@dataclass(frozen=True)
+class Frontmatter:
+    """
+    Parsed frontmatter block plus the document body that follows it.
+
+    'fields' holds 'key: value' lines (first occurrence wins, values are
+    kept verbatim). Treat it as read-only: instances are shared via the cache.
+    """
+    fields: Dict[str, str] = field(default_factory=dict)
+    body: str = ''
+    present: bool = False
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.fields.get('name')
+
+    @property
+    def description(self) -> Optional[str]:
+        return self.fields.get('description')
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.fields.get('version')
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self.fields.get(key, default)
+
+
+def parse_frontmatter(content: str) -> Frontmatter:
+    """
+    Parse frontmatter from document content.
+
+    The block must open on the first line and close on the next line that
+    is exactly '---'. Documents without a (closed) block keep their full
+    content as body and report the problem in 'error'.
+
+    Args:
+        content: Full document text
+
+    Returns:
+        Frontmatter object
+    """
+    lines = content.splitlines(keepends=True)
+    if not lines or lines[0].rstrip() != FRONTMATTER_DELIMITER:
+        return Frontmatter(body=content, error="missing frontmatter (must start with ---)")
+
+    fields = {}
+    for index in range(1, len(lines)):
+        line = lines[index].strip()
+        if line == FRONTMATTER_DELIMITER:
+            return Frontmatter(
+                fields=fields,
+                body=''.join(lines[index + 1:]),
+                present=True
+            )
+        if ':' in line:
+            key, value = line.split(':', 1)
+            fields.setdefault(key.strip(), value.strip())
+
+    return Frontmatter(body=content, error="frontmatter not closed (missing second ---)")
+
+
+def load_frontmatter(path: str) -> Frontmatter:
+    """
+    Read and parse a file's frontmatter, reusing the cached result while the
+    file's mtime and size are unchanged. At most CACHE_MAX_ENTRIES files are
+    cached; use parse_frontmatter() for documents that are read only once.
+
+    Args:
+        path: Path to a markdown file
+
+    Returns:
+        Frontmatter object
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    path = os.path.abspath(path)
+    stat_result = os.stat(path)
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        _CACHE.move_to_end(path)
+        return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        parsed = parse_frontmatter(f.read())
+    _CACHE[path] = (signature, parsed)
+    _CACHE.move_to_end(path)
+    while len(_CACHE) > CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+    return parsed
+
+
+def clear_cache() -> None:
+    """Drop all cached parse results"""
+    _CACHE.clear()